@@ -221,6 +221,9 @@ class EmsZoneClimate(CoordinatorEntity["EmsZoneMasterCoordinator"], ClimateEntit
         else:
             self._zone.manual_setpoint_schedule_state = None
 
+        # Queue persistence of the manual setpoint
+        self.coordinator.mark_zone_dirty(self._zone_name)
+
         # Request coordinator update
         await self.coordinator.async_request_refresh()
 
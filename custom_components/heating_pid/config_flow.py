@@ -21,6 +21,7 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import selector
 
 from .const import (
@@ -1022,8 +1023,6 @@ class EmsZoneMasterOptionsFlow(OptionsFlow):
 
                 if old_zone_name != new_zone_name:
                     # Remove old device from registry (cascades to entities)
-                    from homeassistant.helpers import device_registry as dr
-
                     device_registry = dr.async_get(self.hass)
                     old_device_id = (DOMAIN, f"{self.config_entry.entry_id}_{old_zone_name}")
                     old_device = device_registry.async_get_device(identifiers={old_device_id})
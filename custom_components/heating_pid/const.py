@@ -87,8 +87,11 @@ DEFAULT_KE: Final = 0.02  # Outdoor compensation gain
 SYNC_LOOK_AHEAD: Final = 45  # Time window for synchronization (minutes)
 MIN_EFFICIENT_DELTA_T: Final = 5.0  # Delta-T threshold for cooldown mode (°C)
 PERSISTENCE_INTERVAL: Final = 60  # State save frequency (minutes)
+PERSISTENCE_BATCH_WAIT: Final = 60  # Delay before flushing dirty zones (seconds)
+PERSISTENCE_BATCH_MAX: Final = 8  # Dirty zone count that triggers immediate flush
 INITIAL_WARMUP_GUESS: Final = 30.0  # Starting warmup factor (min/°C)
 COORDINATOR_UPDATE_INTERVAL: Final = 30  # Data update interval (seconds)
+SERVICE_CALL_TIMEOUT: Final = 5.0  # Max wait for heater/valve service calls (seconds)
 
 # Valve maintenance
 VALVE_MAINTENANCE_DAYS: Final = 7  # Days of inactivity before maintenance cycle
@@ -11,15 +11,17 @@ The coordinator is the central hub that:
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -74,6 +76,8 @@ from .const import (
     DOMAIN,
     INITIAL_WARMUP_GUESS,
     MIN_EFFICIENT_DELTA_T,
+    PERSISTENCE_BATCH_MAX,
+    PERSISTENCE_BATCH_WAIT,
     PERSISTENCE_INTERVAL,
     SYNC_LOOK_AHEAD,
     VALVE_MAINTENANCE_DAYS,
@@ -90,6 +94,11 @@ from .schedule import ScheduleReader
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor states that can never parse as numbers. Frozenset membership is a
+# single hash probe and also short-circuits empty/"None" strings that would
+# otherwise raise in float().
+_BAD_STATES: frozenset[str] = frozenset(("unknown", "unavailable", "None", ""))
+
 
 class ZoneState:
     """Holds runtime state for a single heating zone.
@@ -110,12 +119,53 @@ class ZoneState:
         window_open: Whether window is detected as open
         warmup_factor: Learned minutes per degree for adaptive start
         schedule_reader: Schedule reader instance (if schedule configured)
+        schedule_active: Cached schedule state, refreshed at transitions
+        next_active_at: Cached start of next scheduled active period
         adaptive_start_active: Whether adaptive start preheat is active
         warmup_started_at: When current warmup cycle started (for learning)
         warmup_start_temp: Temperature when warmup started (for learning)
         warmup_target_temp: Target temperature for warmup (for learning)
     """
 
+    __slots__ = (
+        "name",
+        "temp_entity_id",
+        "valve_entity_id",
+        "valve_domain",
+        "window_entity_id",
+        "schedule_entity_id",
+        "default_setpoint",
+        "setpoint",
+        "away_temp",
+        "current_temp",
+        "demand",
+        "pid",
+        "manual_setpoint",
+        "manual_setpoint_schedule_state",
+        "window_open",
+        "disabled",
+        "disabled_reason",
+        "warmup_factor",
+        "solar_drop",
+        "schedule_reader",
+        "adaptive_start_active",
+        "sync_forced",
+        "schedule_active",
+        "scheduled_setpoint",
+        "next_active_at",
+        "next_block_setpoint",
+        "schedule_cache_valid",
+        "schedule_cache_token",
+        "schedule_heap_deadline",
+        "warmup_started_at",
+        "warmup_start_temp",
+        "warmup_target_temp",
+        "last_valve_activity",
+        "valve_maintenance_pending",
+        "valve_opened_mono",
+        "valve_closed_mono",
+    )
+
     def __init__(
         self,
         name: str,
@@ -130,6 +180,8 @@ class ZoneState:
         self.name = name
         self.temp_entity_id = temp_entity_id
         self.valve_entity_id = valve_entity_id
+        # Cache the valve domain once (partition avoids a list allocation)
+        self.valve_domain: str = valve_entity_id.partition(".")[0]
         self.window_entity_id = window_entity_id
         self.schedule_entity_id = schedule_entity_id
         self.default_setpoint = default_setpoint
@@ -151,6 +203,15 @@ class ZoneState:
         self.adaptive_start_active: bool = False
         self.sync_forced: bool = False  # Forced to start early due to synchronization
 
+        # Cached schedule state (refreshed only at schedule transitions)
+        self.schedule_active: bool = False
+        self.scheduled_setpoint: float = default_setpoint
+        self.next_active_at: datetime | None = None
+        self.next_block_setpoint: float | None = None
+        self.schedule_cache_valid: bool = False
+        self.schedule_cache_token: datetime | None = None  # Schedule entity last_updated
+        self.schedule_heap_deadline: float | None = None  # Deadline in coordinator heap
+
         # Warmup learning state
         self.warmup_started_at: datetime | None = None
         self.warmup_start_temp: float | None = None
@@ -161,8 +222,9 @@ class ZoneState:
         self.valve_maintenance_pending: bool = False
 
         # Valve anti-cycling protection
-        self.valve_opened_at: datetime | None = None
-        self.valve_closed_at: datetime | None = None
+        # Monotonic timestamps for anti-cycling windows (wall-clock-safe)
+        self.valve_opened_mono: float | None = None
+        self.valve_closed_mono: float | None = None
 
 
 class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -203,6 +265,10 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self.store = store
         self.zones: dict[str, ZoneState] = {}
+        # Frozen iteration view of the zones; rebuilt only when the zones
+        # dict mutates (avoids dict-view creation in per-tick loops)
+        self._zones_tuple: tuple[ZoneState, ...] = ()
+        self._schedulable_zones: tuple[ZoneState, ...] = ()
         self._heater_entity_id: str = entry.data[CONF_HEATER_ENTITY]
         self._flow_temp_entity_id: str = entry.data[CONF_FLOW_TEMP_ENTITY]
         self._return_temp_entity_id: str = entry.data[CONF_RETURN_TEMP_ENTITY]
@@ -248,11 +314,40 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._solar_power: float | None = None
         self._target_flow_temp: float = self._min_egress
         self._max_demand: float = 0.0
+        self._zone_demand_snapshot: list[tuple[ZoneState, float]] = []
         self._cooldown_active: bool = False
+        self._idle_since_mono: float | None = None  # Steady-idle valve skip
+
+        # Device info is immutable - built lazily and cached
+        self._device_info: DeviceInfo | None = None
+        self._zone_device_infos: dict[str, DeviceInfo] = {}
         self._heater_was_active: bool = False  # Track if heater was actively commanded
-        self._unsub_persistence: CALLBACK_TYPE | None = None
         self._last_update: datetime | None = None  # Track time for PID dt calculation
 
+        # Min-heap of (deadline_ts, zone_name) schedule transitions. Zones are
+        # only re-polled for schedule data when their deadline has passed.
+        self._next_event_heap: list[tuple[float, str]] = []
+        # Minute bucket of the last schedule-entity edit scan; the scan is
+        # memoized so it runs at most once per minute across ticks
+        self._sched_token_bucket: int = -1
+
+        # Zones with unsaved learned data; flushed by a debounced batcher
+        self._dirty_zones: set[str] = set()
+        self._unsub_dirty_flush: CALLBACK_TYPE | None = None
+
+        # Fingerprint of sensor inputs from the previous tick, used to skip
+        # the control pipeline when nothing changed and the system is idle
+        self._last_fingerprint: tuple[Any, ...] | None = None
+
+        # Cached per-tick debug flag; guards argument construction for
+        # per-zone debug logging in hot paths
+        self._debug: bool = False
+
+        # Parsed sensor values keyed by entity, tagged with the state object
+        # they were parsed from. HA replaces state objects on change, so an
+        # identity match means the cached float is still valid.
+        self._float_cache: dict[str, tuple[object, float | None]] = {}
+
         # Away mode state
         self._presence_entity_id: str | None = entry.data.get(CONF_PRESENCE_ENTITY)
         self._away_delay: int = entry.data.get(CONF_AWAY_DELAY, DEFAULT_AWAY_DELAY)
@@ -293,42 +388,91 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Set up event-driven tracking for window sensors
         self._setup_window_tracking()
 
-        # Set up periodic persistence
-        self._unsub_persistence = async_track_time_interval(
-            hass,
-            self._async_persist_state,
-            timedelta(minutes=PERSISTENCE_INTERVAL),
-        )
+        # Periodic persistence rides on the coordinator update cadence
+        # (see _async_update_data) instead of a separate interval timer
+        self._last_persist_ts: float = hass.loop.time()
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator and clean up resources."""
         # Shutdown state debouncer (cancels event listeners)
         self._state_debouncer.shutdown()
 
-        # Cancel persistence timer
-        if self._unsub_persistence:
-            self._unsub_persistence()
-            self._unsub_persistence = None
+        # Detach schedule state listeners
+        for zone in self._zones_tuple:
+            if zone.schedule_reader is not None:
+                zone.schedule_reader.async_unload()
+
+        # Cancel any pending dirty-zone flush (final save covers it)
+        if self._unsub_dirty_flush:
+            self._unsub_dirty_flush()
+            self._unsub_dirty_flush = None
 
         # Final state save
         await self._do_persist_state()
         _LOGGER.debug("Coordinator shutdown complete")
 
-    @callback
-    def _async_persist_state(self, _now: datetime) -> None:
-        """Persist current state to storage (scheduled callback).
+    def mark_zone_dirty(self, zone_name: str) -> None:
+        """Mark a zone's learned data as needing persistence.
 
-        Saves PID integrals and warmup factors for all zones.
+        Dirty zones are flushed by a debounced batcher: the first mark
+        schedules a flush after PERSISTENCE_BATCH_WAIT seconds; when
+        PERSISTENCE_BATCH_MAX zones are dirty the flush runs immediately.
+        This persists rare but important changes (manual setpoints, learned
+        warmup factors) without waiting for the hourly snapshot.
+
+        Args:
+            zone_name: Name of the zone with changed data
         """
-        self.hass.async_create_task(self._do_persist_state())
+        self._dirty_zones.add(zone_name)
+
+        if len(self._dirty_zones) >= PERSISTENCE_BATCH_MAX:
+            if self._unsub_dirty_flush:
+                self._unsub_dirty_flush()
+                self._unsub_dirty_flush = None
+            self.hass.async_create_task(self._flush_dirty_zones())
+        elif self._unsub_dirty_flush is None:
+            self._unsub_dirty_flush = async_call_later(
+                self.hass,
+                PERSISTENCE_BATCH_WAIT,
+                self._async_flush_dirty_zones,
+            )
+
+    @callback
+    def _async_flush_dirty_zones(self, _now: datetime) -> None:
+        """Flush dirty zones (scheduled callback)."""
+        self._unsub_dirty_flush = None
+        self.hass.async_create_task(self._flush_dirty_zones())
+
+    async def _flush_dirty_zones(self) -> None:
+        """Persist learned data for dirty zones only."""
+        if not self._dirty_zones:
+            return
+
+        dirty = self._dirty_zones
+        self._dirty_zones = set()
+
+        for name in dirty:
+            zone = self.zones.get(name)
+            if zone is None:
+                continue
+            self.store.set_pid_integral(name, zone.pid.integral)
+            self.store.set_warmup_factor(name, zone.warmup_factor)
+            self.store.set_manual_setpoint(name, zone.manual_setpoint)
+
+        await self.store.async_save()
+        _LOGGER.debug("Flushed dirty state for %d zones", len(dirty))
 
     async def _do_persist_state(self) -> None:
-        """Actually persist state to storage."""
-        for name, zone in self.zones.items():
+        """Actually persist state to storage (full snapshot of all zones)."""
+        for zone in self._zones_tuple:
+            name = zone.name
             self.store.set_pid_integral(name, zone.pid.integral)
             self.store.set_warmup_factor(name, zone.warmup_factor)
             self.store.set_manual_setpoint(name, zone.manual_setpoint)
 
+        # Full snapshot supersedes any pending dirty-zone flush
+        self._dirty_zones.clear()
+
         await self.store.async_save()
         _LOGGER.debug("Persisted state for %d zones", len(self.zones))
 
@@ -432,13 +576,23 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             self.zones[name] = zone
 
+        self._zones_tuple = tuple(self.zones.values())
+        self._schedulable_zones = tuple(
+            zone for zone in self._zones_tuple if zone.schedule_reader is not None
+        )
+
+        # Zone layout is fixed for the lifetime of the entry - specialize
+        # the state-dict builder once so the per-tick call binds zones and
+        # names as locals instead of walking the dict each cycle
+        self._state_builder = self._make_state_builder()
+
     def _setup_window_tracking(self) -> None:
         """Set up event-driven tracking for window sensors.
 
         Window sensors are tracked with a 30-second debounce to prevent
         rapid state toggling from causing excessive updates.
         """
-        for zone in self.zones.values():
+        for zone in self._zones_tuple:
             if zone.window_entity_id:
                 self._state_debouncer.track_entity(
                     zone.window_entity_id,
@@ -522,14 +676,40 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             UpdateFailed: If critical sensors cannot be read
         """
         try:
+            # Re-evaluate once per tick; log level can change at runtime
+            self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
             # Track time for PID dt calculation
             now = dt_util.now()
             dt = (now - self._last_update).total_seconds() if self._last_update else 30.0
             self._last_update = now
 
+            # Periodic full persistence snapshot, dispatched from the main
+            # update loop rather than a separate interval timer
+            loop_now = self.hass.loop.time()
+            if loop_now - self._last_persist_ts >= PERSISTENCE_INTERVAL * 60:
+                self._last_persist_ts = loop_now
+                self.hass.async_create_task(self._do_persist_state())
+
             # Phase 3: Read all sensor states
             await self._read_sensor_states()
 
+            # Refresh cached schedule state for zones whose transition passed
+            cache_refreshed = self._refresh_schedule_cache(now)
+
+            # Skip the control pipeline if inputs are identical to last tick
+            # and the system is provably idle (no demand, heater off)
+            fingerprint = self._compute_fingerprint()
+            if (
+                self.data is not None
+                and not cache_refreshed
+                and fingerprint == self._last_fingerprint
+                and self._can_skip_idle_update(now)
+            ):
+                _LOGGER.debug("Inputs unchanged and system idle - skipping update")
+                return self.data
+            self._last_fingerprint = fingerprint
+
             # Phase 7: Apply smart synchronization
             self._apply_synchronization()
 
@@ -574,20 +754,21 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._solar_power = self._get_sensor_value(self._solar_power_entity_id)
 
         # Read zone sensors
-        for zone in self.zones.values():
+        for zone in self._zones_tuple:
             zone.current_temp = self._get_sensor_value(zone.temp_entity_id)
 
             # Read window state if configured
             if zone.window_entity_id:
                 zone.window_open = self._get_binary_sensor_state(zone.window_entity_id)
 
-        _LOGGER.debug(
-            "Sensor states: flow=%.1f, return=%.1f, outdoor=%.1f, solar=%s",
-            self._current_flow_temp or 0,
-            self._current_return_temp or 0,
-            self._outdoor_temp or 0,
-            self._solar_power,
-        )
+        if self._debug:
+            _LOGGER.debug(
+                "Sensor states: flow=%.1f, return=%.1f, outdoor=%.1f, solar=%s",
+                self._current_flow_temp or 0,
+                self._current_return_temp or 0,
+                self._outdoor_temp or 0,
+                self._solar_power,
+            )
 
     def _get_sensor_value(self, entity_id: str) -> float | None:
         """Get numeric value from a sensor entity.
@@ -603,15 +784,23 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Entity not found: %s", entity_id)
             return None
 
-        if state.state in ("unknown", "unavailable"):
+        # Reuse the previous parse if the state object is unchanged
+        cached = self._float_cache.get(entity_id)
+        if cached is not None and cached[0] is state:
+            return cached[1]
+
+        if state.state in _BAD_STATES:
             _LOGGER.debug("Entity unavailable: %s", entity_id)
             return None
 
         try:
-            return float(state.state)
+            value: float | None = float(state.state)
         except (ValueError, TypeError):
             _LOGGER.warning("Invalid numeric state for %s: %s", entity_id, state.state)
-            return None
+            value = None
+
+        self._float_cache[entity_id] = (state, value)
+        return value
 
     def _get_binary_sensor_state(self, entity_id: str) -> bool:
         """Get boolean state from a binary sensor entity.
@@ -629,6 +818,167 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return state.state == "on"
 
+    def _refresh_schedule_cache(self, now: datetime) -> bool:
+        """Refresh cached schedule state for zones that need it.
+
+        Schedule queries parse entity attributes on every call, but their
+        results only change at schedule transitions (or when the helper is
+        edited). Each zone's next transition is tracked in a min-heap so a
+        zone is only re-polled when its deadline has passed or the schedule
+        entity itself was updated.
+
+        Args:
+            now: Current datetime
+
+        Returns:
+            True if any zone's schedule cache was refreshed
+        """
+        now_ts = now.timestamp()
+        refreshed = False
+
+        # Invalidate zones whose cached transition deadline has passed
+        while self._next_event_heap and self._next_event_heap[0][0] <= now_ts:
+            deadline, zone_name = heapq.heappop(self._next_event_heap)
+            zone = self.zones.get(zone_name)
+            if zone is None or zone.schedule_heap_deadline != deadline:
+                continue  # Stale entry - zone was refreshed since this push
+            zone.schedule_cache_valid = False
+
+        # The edit-detection scan below only guards against the schedule
+        # helper being edited/reloaded, so memoize it per minute bucket
+        # instead of re-running it on every 30s tick
+        minute_bucket = int(now_ts // 60)
+        check_tokens = minute_bucket != self._sched_token_bucket
+        self._sched_token_bucket = minute_bucket
+
+        for zone in self._zones_tuple:
+            if zone.schedule_reader is None:
+                continue
+
+            token = zone.schedule_cache_token
+            if check_tokens or not zone.schedule_cache_valid:
+                # Invalidate if the schedule entity changed (edited/reloaded)
+                state = self.hass.states.get(zone.schedule_reader.entity_id)
+                token = state.last_updated if state is not None else None
+                if token != zone.schedule_cache_token:
+                    zone.schedule_cache_valid = False
+
+            if not zone.schedule_cache_valid:
+                self._refresh_zone_schedule(zone, now, token)
+                refreshed = True
+
+        return refreshed
+
+    def _compute_fingerprint(self) -> tuple[Any, ...]:
+        """Build a cheap fingerprint of all sensor inputs.
+
+        Includes the presence entity state: away-mode transitions are
+        driven solely by that entity inside _update_away_mode, so a
+        presence flip must break the idle skip even when every
+        temperature reading is static.
+
+        Returns:
+            Tuple of all sensor values read this tick
+        """
+        presence_state = None
+        if self._presence_entity_id:
+            presence = self.hass.states.get(self._presence_entity_id)
+            presence_state = presence.state if presence is not None else None
+        return (
+            self._current_flow_temp,
+            self._current_return_temp,
+            self._outdoor_temp,
+            self._solar_power,
+            presence_state,
+            tuple(zone.current_temp for zone in self._zones_tuple),
+            tuple(zone.window_open for zone in self._zones_tuple),
+        )
+
+    def _can_skip_idle_update(self, now: datetime) -> bool:
+        """Check whether the control pipeline can be safely skipped.
+
+        Skipping is only safe when the whole system is quiescent: no zone
+        has demand or is preheating, every zone is at or above setpoint
+        (so PID integrals cannot accumulate), the heater is off, and no
+        time-driven state (away-mode countdown, quiet mode ramp, valve
+        maintenance hour) needs a tick to progress.
+
+        Args:
+            now: Current datetime
+
+        Returns:
+            True if the pipeline would be a no-op this tick
+        """
+        if self._heater_was_active or self._cooldown_active or self._max_demand > 0:
+            return False
+        if self._quiet_mode_active:
+            return False
+        # Away-mode countdown in progress needs ticks to complete
+        if self._presence_lost_at is not None and not self._away_mode_active:
+            return False
+        # Valve maintenance only triggers during its designated hour
+        if now.hour == VALVE_MAINTENANCE_HOUR:
+            return False
+
+        for zone in self._zones_tuple:
+            if zone.disabled:
+                continue
+            if zone.demand > 0 or zone.adaptive_start_active or zone.sync_forced:
+                return False
+            if zone.warmup_started_at is not None or zone.valve_maintenance_pending:
+                return False
+            if zone.current_temp is None or zone.current_temp < zone.setpoint:
+                return False
+
+        return True
+
+    def _refresh_zone_schedule(
+        self, zone: ZoneState, now: datetime, token: datetime | None
+    ) -> None:
+        """Re-poll a zone's schedule reader and cache the results.
+
+        Args:
+            zone: Zone to refresh
+            now: Current datetime
+            token: Schedule entity last_updated timestamp
+        """
+        reader = zone.schedule_reader
+        if reader is None:
+            return
+
+        # Single fused read of the schedule entity
+        snapshot = reader.evaluate(now)
+
+        zone.schedule_active = snapshot.is_active
+        zone.scheduled_setpoint = snapshot.current_setpoint
+
+        if snapshot.is_active or snapshot.time_to_next_active is None:
+            zone.next_active_at = None
+        else:
+            zone.next_active_at = now + snapshot.time_to_next_active
+
+        zone.next_block_setpoint = snapshot.next_setpoint
+        zone.schedule_cache_token = token
+        zone.schedule_cache_valid = True
+
+        # Schedule the next refresh at the next transition. Without a known
+        # next event, fall back to a periodic re-poll.
+        next_event = snapshot.time_to_next_event
+        if next_event is not None and next_event > timedelta(0):
+            deadline = (now + next_event).timestamp()
+        else:
+            deadline = now.timestamp() + 300.0
+
+        zone.schedule_heap_deadline = deadline
+        heapq.heappush(self._next_event_heap, (deadline, zone.name))
+
+        _LOGGER.debug(
+            "Zone %s: schedule cache refreshed (active=%s, next deadline in %.0fs)",
+            zone.name,
+            zone.schedule_active,
+            deadline - now.timestamp(),
+        )
+
     def _apply_synchronization(self) -> None:
         """Apply smart synchronization to coordinate zone heating starts.
 
@@ -643,29 +993,39 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         3. If multiple starts fall within the window, use the earliest
         4. Set sync_forced flag on zones that are started early
         """
-        now = dt_util.now()
-        sync_window = timedelta(minutes=SYNC_LOOK_AHEAD)
-
-        # Collect zones with upcoming starts and their required start times
-        zone_starts: list[tuple[ZoneState, datetime]] = []
+        # Synchronization is only meaningful with at least two scheduled zones
+        if len(self._schedulable_zones) < 2:
+            return
 
-        for zone in self.zones.values():
+        now = dt_util.now()
+        # Work in plain seconds: one total_seconds() per zone instead of
+        # a handful of timedelta allocations and comparisons
+        sync_window_s = SYNC_LOOK_AHEAD * 60.0
+
+        # Collect zones with upcoming starts and their required start offsets
+        # (seconds from now), tracking the earliest/latest start in the same
+        # pass (no sort needed)
+        zone_starts: list[tuple[ZoneState, float]] = []
+        earliest_start_s: float | None = None
+        latest_start_s: float | None = None
+
+        for zone in self._schedulable_zones:
             zone.sync_forced = False  # Reset sync flag
 
-            if zone.schedule_reader is None or zone.current_temp is None:
+            if zone.current_temp is None:
                 continue
 
             # Skip if already in active period or manual mode
-            if zone.schedule_reader.is_schedule_active(now) or zone.manual_setpoint is not None:
+            if zone.schedule_active or zone.manual_setpoint is not None:
                 continue
 
-            # Get time to next scheduled active period
-            time_to_active = zone.schedule_reader.get_time_to_next_active(now)
-            if time_to_active is None:
+            # Get time to next scheduled active period (cached)
+            if zone.next_active_at is None:
                 continue
+            time_to_active_s = (zone.next_active_at - now).total_seconds()
 
             # Calculate when this zone needs to start heating (with adaptive start)
-            target_temp = zone.schedule_reader.get_next_block_setpoint(now)
+            target_temp = zone.next_block_setpoint
             if target_temp is None:
                 continue
 
@@ -674,37 +1034,31 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if temp_delta <= 0:
                 continue  # Already at target
 
-            preheat_minutes = temp_delta * zone.warmup_factor
-            preheat_time = timedelta(minutes=preheat_minutes)
-
-            # Calculate absolute start time
-            scheduled_active_time = now + time_to_active
-            required_start_time = scheduled_active_time - preheat_time
+            # Seconds from now until this zone must start preheating
+            time_until_start_s = (
+                time_to_active_s - temp_delta * zone.warmup_factor * 60.0
+            )
 
             # Only consider zones that need to start within sync window
-            time_until_start = required_start_time - now
-            if timedelta(0) <= time_until_start <= sync_window:
-                zone_starts.append((zone, required_start_time))
+            if 0.0 <= time_until_start_s <= sync_window_s:
+                zone_starts.append((zone, time_until_start_s))
+                if earliest_start_s is None or time_until_start_s < earliest_start_s:
+                    earliest_start_s = time_until_start_s
+                if latest_start_s is None or time_until_start_s > latest_start_s:
+                    latest_start_s = time_until_start_s
 
         # If multiple zones have upcoming starts, synchronize them
-        if len(zone_starts) > 1:
-            # Sort by required start time
-            zone_starts.sort(key=lambda x: x[1])
-
-            # Get the earliest required start time
-            earliest_start = zone_starts[0][1]
-
+        if len(zone_starts) > 1 and earliest_start_s is not None and latest_start_s is not None:
             # Check if all starts are within sync window of each other
-            latest_start = zone_starts[-1][1]
-            if latest_start - earliest_start <= sync_window:
+            if latest_start_s - earliest_start_s <= sync_window_s:
                 # Force all zones to start at the earliest time
-                for zone, start_time in zone_starts:
-                    if start_time > earliest_start:
+                for zone, start_s in zone_starts:
+                    if start_s > earliest_start_s:
                         zone.sync_forced = True
                         _LOGGER.info(
                             "Zone %s: synchronized start (%.0f min early)",
                             zone.name,
-                            (start_time - earliest_start).total_seconds() / 60,
+                            (start_s - earliest_start_s) / 60,
                         )
 
     def _update_away_mode(self, now: datetime) -> None:
@@ -755,7 +1109,7 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         now = dt_util.now()
 
-        for zone in self.zones.values():
+        for zone in self._zones_tuple:
             # Check if maintenance is needed using ValveManager
             if self._valve_manager.check_maintenance_needed(
                 zone.last_valve_activity,
@@ -790,13 +1144,26 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             VALVE_MAINTENANCE_DURATION,
         )
 
+        @callback
+        def _on_maintenance_complete() -> None:
+            # Stamp the close so anti-cycling sees a fresh timestamp,
+            # then release the zone back to the regular valve pass
+            zone.valve_closed_mono = time.monotonic()
+            zone.valve_maintenance_pending = False
+
         try:
-            # Use ValveManager to perform maintenance
+            # Use ValveManager to perform maintenance; the pending flag
+            # stays set (and the valve pass skips this zone) until the
+            # scheduled close has gone out
             zone.last_valve_activity = await self._valve_manager.perform_maintenance(
                 zone.valve_entity_id,
                 VALVE_MAINTENANCE_DURATION,
+                zone.valve_domain,
+                dt_util.now(),
+                _on_maintenance_complete,
             )
-            _LOGGER.info("Zone %s: valve maintenance complete", zone.name)
+            zone.valve_opened_mono = time.monotonic()
+            _LOGGER.info("Zone %s: valve maintenance cycle started", zone.name)
 
         except Exception as err:
             _LOGGER.error(
@@ -804,8 +1171,6 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 zone.name,
                 err,
             )
-        finally:
-            # Reset pending flag when task completes (success or failure)
             zone.valve_maintenance_pending = False
 
     def _update_zone_demands(self, dt: float) -> None:
@@ -823,81 +1188,102 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         now = dt_util.now()
 
-        for zone in self.zones.values():
+        # Track max demand and the valve snapshot inside this loop - the
+        # PID pass already visits every zone, so a separate scan in
+        # _update_heater_control would just repeat the iteration.
+        max_demand = 0.0
+        snapshot = []
+
+        for zone in self._zones_tuple:
             # Skip disabled zones
             if zone.disabled:
                 zone.demand = 0.0
+                snapshot.append((zone, 0.0))
                 continue
 
             # Skip if no temperature reading
             if zone.current_temp is None:
-                _LOGGER.debug("Skipping zone %s: no temperature reading", zone.name)
+                if self._debug:
+                    _LOGGER.debug("Skipping zone %s: no temperature reading", zone.name)
                 zone.demand = 0.0
+                snapshot.append((zone, 0.0))
                 continue
 
-            # Check if manual setpoint should expire (schedule transitioned)
-            if zone.manual_setpoint is not None and zone.schedule_reader is not None:
-                current_schedule_state = zone.schedule_reader.is_schedule_active(now)
-                if zone.manual_setpoint_schedule_state is not None:
-                    if current_schedule_state != zone.manual_setpoint_schedule_state:
-                        # Schedule transitioned - clear manual override
-                        _LOGGER.info(
-                            "Zone %s: clearing manual setpoint (schedule transitioned)",
-                            zone.name,
-                        )
-                        zone.manual_setpoint = None
-                        zone.manual_setpoint_schedule_state = None
+            # Check if manual setpoint should expire (schedule transitioned).
+            # Only compare when the override is tied to a schedule snapshot;
+            # otherwise there is nothing to expire.
+            if (
+                zone.manual_setpoint is not None
+                and zone.manual_setpoint_schedule_state is not None
+                and zone.schedule_reader is not None
+            ):
+                if zone.schedule_active != zone.manual_setpoint_schedule_state:
+                    # Schedule transitioned - clear manual override
+                    _LOGGER.info(
+                        "Zone %s: clearing manual setpoint (schedule transitioned)",
+                        zone.name,
+                    )
+                    zone.manual_setpoint = None
+                    zone.manual_setpoint_schedule_state = None
+                    self.mark_zone_dirty(zone.name)
 
             # Determine effective setpoint (priority: away > manual > schedule > default)
             if self._away_mode_active:
                 zone.setpoint = zone.away_temp
                 zone.adaptive_start_active = False
-                _LOGGER.debug(
-                    "Zone %s: away mode, using away temp %.1f°C",
-                    zone.name,
-                    zone.away_temp,
-                )
+                if self._debug:
+                    _LOGGER.debug(
+                        "Zone %s: away mode, using away temp %.1f°C",
+                        zone.name,
+                        zone.away_temp,
+                    )
             elif zone.manual_setpoint is not None:
                 zone.setpoint = zone.manual_setpoint
                 zone.adaptive_start_active = False
             elif zone.schedule_reader is not None:
-                # Get scheduled setpoint
-                scheduled_setpoint = zone.schedule_reader.get_current_setpoint(now)
+                # Get scheduled setpoint (cached, refreshed at transitions)
+                scheduled_setpoint = zone.scheduled_setpoint
 
                 # Check for adaptive start or sync-forced preheat
-                if not zone.schedule_reader.is_schedule_active(now):
+                if not zone.schedule_active:
                     # Currently in setback period, check if we need to preheat
-                    time_to_active = zone.schedule_reader.get_time_to_next_active(now)
+                    time_to_active_s = (
+                        (zone.next_active_at - now).total_seconds()
+                        if zone.next_active_at is not None
+                        else None
+                    )
                     # Get the target temp from the next schedule block
-                    target_temp = zone.schedule_reader.get_next_block_setpoint(now)
+                    target_temp = zone.next_block_setpoint
 
-                    if time_to_active is not None and target_temp is not None:
+                    if time_to_active_s is not None and target_temp is not None:
                         temp_delta = target_temp - zone.current_temp
 
                         if zone.sync_forced:
                             # Forced by synchronization - start heating now
                             zone.adaptive_start_active = True
                             zone.setpoint = target_temp
-                            _LOGGER.debug(
-                                "Zone %s: sync-forced preheat to %.1f°C",
-                                zone.name,
-                                target_temp,
-                            )
+                            if self._debug:
+                                _LOGGER.debug(
+                                    "Zone %s: sync-forced preheat to %.1f°C",
+                                    zone.name,
+                                    target_temp,
+                                )
                         elif temp_delta > 0:
-                            preheat_minutes = temp_delta * zone.warmup_factor
-                            preheat_time = timedelta(minutes=preheat_minutes)
+                            # Start preheating if within preheat window;
+                            # compare in seconds, no timedelta allocation
+                            preheat_s = temp_delta * zone.warmup_factor * 60.0
 
-                            # Start preheating if within preheat window
-                            if time_to_active <= preheat_time:
+                            if time_to_active_s <= preheat_s:
                                 zone.adaptive_start_active = True
                                 zone.setpoint = target_temp
-                                _LOGGER.debug(
-                                    "Zone %s: adaptive start activated, "
-                                    "preheating %.1f°C in %.0f min",
-                                    zone.name,
-                                    temp_delta,
-                                    time_to_active.total_seconds() / 60,
-                                )
+                                if self._debug:
+                                    _LOGGER.debug(
+                                        "Zone %s: adaptive start activated, "
+                                        "preheating %.1f°C in %.0f min",
+                                        zone.name,
+                                        temp_delta,
+                                        time_to_active_s / 60,
+                                    )
                             else:
                                 zone.adaptive_start_active = False
                                 zone.setpoint = scheduled_setpoint
@@ -914,53 +1300,75 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 zone.setpoint = zone.default_setpoint
                 zone.adaptive_start_active = False
 
-            # Apply window drop if window is open
-            effective_setpoint = zone.setpoint
-            if zone.window_open:
-                effective_setpoint -= DEFAULT_WINDOW_DROP
-                _LOGGER.debug(
-                    "Zone %s: window open, reducing setpoint by %.1f°C",
-                    zone.name,
-                    DEFAULT_WINDOW_DROP,
-                )
-
-            # Apply solar limiting if solar power exceeds threshold
-            if (
-                self._solar_power is not None
-                and self._solar_power > self._solar_threshold
-            ):
-                # Use zone-specific solar drop if set, otherwise use global
-                solar_drop = (
-                    zone.solar_drop if zone.solar_drop is not None else self._solar_drop
-                )
-                effective_setpoint -= solar_drop
-                _LOGGER.debug(
-                    "Zone %s: solar limiting (%.0fW), reducing setpoint by %.1f°C",
-                    zone.name,
-                    self._solar_power,
-                    solar_drop,
-                )
+            # Apply window drop and solar limiting in one fused step
+            effective_setpoint = self._compute_effective_setpoint(zone)
 
             # Update PID controller
-            zone.demand = zone.pid.update(
+            demand = zone.pid.update(
                 setpoint=effective_setpoint,
                 process_variable=zone.current_temp,
                 outdoor_temp=self._outdoor_temp,
                 dt=dt,
             )
+            zone.demand = demand
+            if demand > max_demand:
+                max_demand = demand
+            snapshot.append((zone, demand))
 
             # Track warmup for learning
             self._track_warmup_learning(zone, effective_setpoint, now)
 
+            if self._debug:
+                _LOGGER.debug(
+                    "Zone %s: temp=%.1f, setpoint=%.1f, demand=%.1f%%, adaptive=%s",
+                    zone.name,
+                    zone.current_temp,
+                    effective_setpoint,
+                    zone.demand,
+                    zone.adaptive_start_active,
+                )
+
+        self._max_demand = max_demand
+        self._zone_demand_snapshot = snapshot
+
+    def _compute_effective_setpoint(self, zone: ZoneState) -> float:
+        """Compute the setpoint after window and solar adjustments.
+
+        Fuses the window-drop and solar-limiting branches into a single
+        expression with one debug line, instead of two independent
+        read-modify-log blocks per zone per tick.
+
+        Args:
+            zone: Zone state to adjust
+
+        Returns:
+            Effective setpoint for the PID update
+        """
+        window_drop = DEFAULT_WINDOW_DROP if zone.window_open else 0.0
+
+        if self._solar_power is not None and self._solar_power > self._solar_threshold:
+            # Use zone-specific solar drop if set, otherwise use global
+            solar_drop = (
+                zone.solar_drop if zone.solar_drop is not None else self._solar_drop
+            )
+        else:
+            solar_drop = 0.0
+
+        effective_setpoint = zone.setpoint - window_drop - solar_drop
+
+        if self._debug and (window_drop or solar_drop):
             _LOGGER.debug(
-                "Zone %s: temp=%.1f, setpoint=%.1f, demand=%.1f%%, adaptive=%s",
+                "Zone %s: setpoint %.1f°C adjusted to %.1f°C "
+                "(window drop %.1f, solar drop %.1f)",
                 zone.name,
-                zone.current_temp,
+                zone.setpoint,
                 effective_setpoint,
-                zone.demand,
-                zone.adaptive_start_active,
+                window_drop,
+                solar_drop,
             )
 
+        return effective_setpoint
+
     def _track_warmup_learning(
         self, zone: ZoneState, target_setpoint: float, now: datetime
     ) -> None:
@@ -979,61 +1387,65 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         temp_delta = target_setpoint - zone.current_temp
         at_target = temp_delta <= 0.2  # Within 0.2°C of target
+        tracking = zone.warmup_started_at is not None
+
+        # Evaluate all state transitions up front as flat predicates,
+        # then dispatch once - avoids nested per-zone branching
+        should_start = not tracking and temp_delta > 0.5 and zone.demand > 10
+        should_complete = tracking and at_target and zone.warmup_start_temp is not None
+        should_cancel = tracking and not should_complete and zone.demand < 5
+
+        if should_start:
+            # Start tracking: heating needed and demand is significant
+            zone.warmup_started_at = now
+            zone.warmup_start_temp = zone.current_temp
+            zone.warmup_target_temp = target_setpoint
+            _LOGGER.debug(
+                "Zone %s: started warmup tracking at %.1f°C, target %.1f°C",
+                zone.name,
+                zone.current_temp,
+                target_setpoint,
+            )
+            return
 
-        if zone.warmup_started_at is None:
-            # Not currently tracking a warmup
-            if temp_delta > 0.5 and zone.demand > 10:
-                # Start tracking: heating needed and demand is significant
-                zone.warmup_started_at = now
-                zone.warmup_start_temp = zone.current_temp
-                zone.warmup_target_temp = target_setpoint
-                _LOGGER.debug(
-                    "Zone %s: started warmup tracking at %.1f°C, target %.1f°C",
-                    zone.name,
-                    zone.current_temp,
-                    target_setpoint,
-                )
-        else:
-            # Currently tracking warmup
-            if at_target and zone.warmup_start_temp is not None:
-                # Reached target - calculate and update warmup factor
-                elapsed = (now - zone.warmup_started_at).total_seconds() / 60
-                temp_rise = zone.current_temp - zone.warmup_start_temp
-
-                if temp_rise > 0.5:  # Meaningful temperature rise
-                    measured_factor = elapsed / temp_rise
-
-                    # Exponential smoothing (alpha = 0.3)
-                    alpha = 0.3
-                    old_factor = zone.warmup_factor
-                    zone.warmup_factor = (
-                        alpha * measured_factor + (1 - alpha) * zone.warmup_factor
-                    )
+        if should_complete:
+            # Reached target - calculate and update warmup factor
+            elapsed = (now - zone.warmup_started_at).total_seconds() / 60
+            temp_rise = zone.current_temp - zone.warmup_start_temp
 
-                    _LOGGER.info(
-                        "Zone %s: warmup complete in %.0f min for %.1f°C rise, "
-                        "factor: %.1f -> %.1f min/°C",
-                        zone.name,
-                        elapsed,
-                        temp_rise,
-                        old_factor,
-                        zone.warmup_factor,
-                    )
+            if temp_rise > 0.5:  # Meaningful temperature rise
+                measured_factor = elapsed / temp_rise
 
-                # Reset tracking
-                zone.warmup_started_at = None
-                zone.warmup_start_temp = None
-                zone.warmup_target_temp = None
+                # Exponential smoothing (alpha = 0.3)
+                alpha = 0.3
+                old_factor = zone.warmup_factor
+                zone.warmup_factor = (
+                    alpha * measured_factor + (1 - alpha) * zone.warmup_factor
+                )
+                self.mark_zone_dirty(zone.name)
 
-            elif zone.demand < 5:
-                # Demand dropped significantly - cancel tracking
-                _LOGGER.debug(
-                    "Zone %s: cancelled warmup tracking (demand dropped)",
+                _LOGGER.info(
+                    "Zone %s: warmup complete in %.0f min for %.1f°C rise, "
+                    "factor: %.1f -> %.1f min/°C",
                     zone.name,
+                    elapsed,
+                    temp_rise,
+                    old_factor,
+                    zone.warmup_factor,
                 )
-                zone.warmup_started_at = None
-                zone.warmup_start_temp = None
-                zone.warmup_target_temp = None
+
+        elif should_cancel:
+            # Demand dropped significantly - cancel tracking
+            _LOGGER.debug(
+                "Zone %s: cancelled warmup tracking (demand dropped)",
+                zone.name,
+            )
+
+        if should_complete or should_cancel:
+            # Reset tracking
+            zone.warmup_started_at = None
+            zone.warmup_start_temp = None
+            zone.warmup_target_temp = None
 
     async def _update_heater_control(self) -> None:
         """Calculate and apply heater control output.
@@ -1045,11 +1457,8 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         Note: Solar limiting is handled at zone level in _update_zone_demands.
         """
-        # Find maximum demand across all zones
-        if self.zones:
-            self._max_demand = max(zone.demand for zone in self.zones.values())
-        else:
-            self._max_demand = 0.0
+        # Max demand and the valve snapshot are maintained by
+        # _update_zone_demands in the same loop that runs the PIDs.
 
         # Calculate target flow temperature using HeaterController
         now = dt_util.now()
@@ -1065,59 +1474,137 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._target_flow_temp = target_temp
         self._cooldown_active = cooldown_active
 
-        # Apply to heater entity
-        await self._heater_controller.set_flow_temperature(self._target_flow_temp)
+        # Heater and valves are independent outputs - run both service
+        # round-trips concurrently instead of back to back
+        await asyncio.gather(
+            self._heater_controller.set_flow_temperature(self._target_flow_temp),
+            self._update_valve_states(),
+        )
 
         # Sync heater state from controller
         self._heater_was_active = self._heater_controller.heater_was_active
 
-        # Control zone valves based on demand
-        await self._update_valve_states()
-
     async def _update_valve_states(self) -> None:
         """Control zone valves based on their demand.
 
         Opens valves for zones with demand > 0, closes others.
         Handles both switch and climate entity types.
+
+        Service calls are dispatched concurrently: they are I/O-bound
+        awaits, so overlapping them makes the valve pass take roughly
+        one call's latency instead of one per zone.
         """
-        for zone in self.zones.values():
-            should_open = zone.demand > 0 and not self._cooldown_active
-
-            # Use ValveManager to control the valve
-            zone.valve_opened_at, zone.valve_closed_at, zone.last_valve_activity = (
-                await self._valve_manager.set_valve_state(
-                    zone.valve_entity_id,
-                    zone.valve_opened_at,
-                    zone.valve_closed_at,
-                    zone.setpoint,
-                    should_open,
-                    self._cooldown_active,
+        snapshot = self._zone_demand_snapshot
+        if not snapshot:
+            return
+
+        # Leave zones alone while their maintenance exercise is running;
+        # the close is scheduled out-of-band and a regular pass landing
+        # inside the window would shut the valve mid-cycle
+        if any(zone.valve_maintenance_pending for zone, _demand in snapshot):
+            snapshot = [
+                (zone, demand)
+                for zone, demand in snapshot
+                if not zone.valve_maintenance_pending
+            ]
+            if not snapshot:
+                return
+
+        # Steady-idle short-circuit: once the system has been idle longer
+        # than the min-on window, every valve close has gone through (or
+        # its anti-cycling deferral has expired), so the whole per-zone
+        # pass is a no-op and can be skipped.
+        if self._max_demand == 0.0 or self._cooldown_active:
+            mono_now = time.monotonic()
+            if self._idle_since_mono is None:
+                self._idle_since_mono = mono_now
+            elif mono_now - self._idle_since_mono > self._valve_min_on_time * 60:
+                return
+        else:
+            self._idle_since_mono = None
+
+        # One wall-clock read for the whole pass
+        now = dt_util.now()
+        tasks = [
+            self._valve_manager.set_valve_state(
+                zone.valve_entity_id,
+                zone.valve_opened_mono,
+                zone.valve_closed_mono,
+                zone.setpoint,
+                demand > 0 and not self._cooldown_active,
+                zone.valve_domain,
+                now,
+            )
+            for zone, demand in snapshot
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for (zone, _demand), result in zip(snapshot, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Valve update failed for zone %s: %s", zone.name, result
                 )
+                continue
+            zone.valve_opened_mono, zone.valve_closed_mono, zone.last_valve_activity = (
+                result
             )
 
-    def _build_state_dict(self) -> dict[str, Any]:
-        """Build state dictionary for coordinator data.
+    def _make_state_builder(self) -> Callable[[], dict[str, Any]]:
+        """Create a state-dict builder specialized for the zone layout.
+
+        Zone names and count are fixed once _init_zones has run, so the
+        builder closes over a persistent dict (plus one sub-dict per
+        zone) and mutates its values in place each tick instead of
+        allocating N+1 fresh dicts. Entities treat the coordinator data
+        as read-only per tick, so reuse is safe.
 
         Returns:
-            Dictionary with current state for all entities
+            Callable that refreshes and returns the coordinator data dict
         """
-        return {
-            "flow_temp": self._current_flow_temp,
-            "return_temp": self._current_return_temp,
-            "outdoor_temp": self._outdoor_temp,
-            "target_flow_temp": self._target_flow_temp,
-            "max_demand": self._max_demand,
-            "cooldown_active": self._cooldown_active,
+        state: dict[str, Any] = {
+            "flow_temp": None,
+            "return_temp": None,
+            "outdoor_temp": None,
+            "target_flow_temp": None,
+            "max_demand": 0.0,
+            "cooldown_active": False,
             "zones": {
-                name: {
+                zone.name: {
                     "setpoint": zone.setpoint,
                     "current_temp": zone.current_temp,
-                    "demand": zone.demand,
-                    "window_open": zone.window_open,
+                    "demand": 0.0,
+                    "window_open": False,
                 }
-                for name, zone in self.zones.items()
+                for zone in self._zones_tuple
             },
         }
+        zone_entries = tuple(
+            (zone, state["zones"][zone.name]) for zone in self._zones_tuple
+        )
+
+        def build() -> dict[str, Any]:
+            state["flow_temp"] = self._current_flow_temp
+            state["return_temp"] = self._current_return_temp
+            state["outdoor_temp"] = self._outdoor_temp
+            state["target_flow_temp"] = self._target_flow_temp
+            state["max_demand"] = self._max_demand
+            state["cooldown_active"] = self._cooldown_active
+            for zone, entry in zone_entries:
+                entry["setpoint"] = zone.setpoint
+                entry["current_temp"] = zone.current_temp
+                entry["demand"] = zone.demand
+                entry["window_open"] = zone.window_open
+            return state
+
+        return build
+
+    def _build_state_dict(self) -> dict[str, Any]:
+        """Build state dictionary for coordinator data.
+
+        Returns:
+            Dictionary with current state for all entities
+        """
+        return self._state_builder()
 
     @property
     def max_demand(self) -> float:
@@ -1177,7 +1664,7 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Check each zone's schedule for first block status
         any_zone_in_first_block = False
-        for zone in self.zones.values():
+        for zone in self._zones_tuple:
             if zone.schedule_reader is not None:
                 is_first_block = await zone.schedule_reader.is_first_block_of_day_async(now)
                 if is_first_block:
@@ -1207,27 +1694,38 @@ class EmsZoneMasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for the main EMS Zone Master device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.entry.entry_id)},
-            name="EMS Zone Master",
-            manufacturer="EMS-ESP",
-            model="Zone Master Controller",
-            sw_version=VERSION,
-        )
+        info = self._device_info
+        if info is None:
+            info = DeviceInfo(
+                identifiers={(DOMAIN, self.entry.entry_id)},
+                name="EMS Zone Master",
+                manufacturer="EMS-ESP",
+                model="Zone Master Controller",
+                sw_version=VERSION,
+            )
+            self._device_info = info
+        return info
 
     def get_zone_device_info(self, zone_name: str) -> DeviceInfo:
         """Return device info for a specific zone.
 
+        Device info is immutable per zone, so it is built once and cached
+        instead of re-allocating the identifier set and dict per call.
+
         Args:
             zone_name: Name of the zone
 
         Returns:
             DeviceInfo for the zone, linked to main device
         """
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_{zone_name}")},
-            name=f"Zone: {zone_name}",
-            manufacturer="EMS-ESP",
-            model="Heating Zone",
-            via_device=(DOMAIN, self.entry.entry_id),
-        )
+        info = self._zone_device_infos.get(zone_name)
+        if info is None:
+            info = DeviceInfo(
+                identifiers={(DOMAIN, f"{self.entry.entry_id}_{zone_name}")},
+                name=f"Zone: {zone_name}",
+                manufacturer="EMS-ESP",
+                model="Heating Zone",
+                via_device=(DOMAIN, self.entry.entry_id),
+            )
+            self._zone_device_infos[zone_name] = info
+        return info
@@ -5,13 +5,17 @@ Manages heater flow temperature based on aggregated zone demand.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 
+import voluptuous as vol
+
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
+from homeassistant.exceptions import HomeAssistantError
 
-from .const import MIN_EFFICIENT_DELTA_T
+from .const import MIN_EFFICIENT_DELTA_T, SERVICE_CALL_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,12 +79,26 @@ class HeaterController:
         self._cooldown_hysteresis = cooldown_hysteresis
         self._min_burner_runtime = min_burner_runtime
         self._min_burner_off_time = min_burner_off_time
+        # Runtime windows in seconds so the checks compare monotonic
+        # deltas directly, without a per-check divide
+        self._min_burner_runtime_s = min_burner_runtime * 60
+        self._min_burner_off_time_s = min_burner_off_time * 60
+        # Demand-curve slope, precomputed so the per-cycle formula is a
+        # single multiply-add (quiet mode computes its own slope because
+        # the effective maximum varies during the ramp)
+        self._egress_span_over_100 = (max_egress - min_egress) / 100.0
+
+        # Cached debug-enabled flag; skips argument setup for the hot
+        # per-cycle log lines when DEBUG is off
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
         # Runtime state
         self._heater_was_active: bool = False
         self._cooldown_active: bool = False
-        self._burner_started_at: datetime | None = None
-        self._burner_stopped_at: datetime | None = None
+        # Monotonic timestamps for burner runtime windows (wall-clock-safe)
+        self._burner_started_mono: float | None = None
+        self._burner_stopped_mono: float | None = None
+        self._last_commanded_temp: float | None = None
 
     def calculate_target_flow_temp(
         self,
@@ -122,14 +140,13 @@ class HeaterController:
         burner_should_stay_on = False
         burner_should_stay_off = False
 
-        if self._burner_started_at is not None:
-            runtime_minutes = (now - self._burner_started_at).total_seconds() / 60
-            if runtime_minutes < self._min_burner_runtime:
+        mono_now = time.monotonic()
+        if self._burner_started_mono is not None:
+            if mono_now - self._burner_started_mono < self._min_burner_runtime_s:
                 burner_should_stay_on = True
 
-        if self._burner_stopped_at is not None:
-            off_time_minutes = (now - self._burner_stopped_at).total_seconds() / 60
-            if off_time_minutes < self._min_burner_off_time:
+        if self._burner_stopped_mono is not None:
+            if mono_now - self._burner_stopped_mono < self._min_burner_off_time_s:
                 burner_should_stay_off = True
 
         # Calculate target flow temperature from demand curve
@@ -143,22 +160,25 @@ class HeaterController:
             # Below ignition threshold or in cooldown - turn off
             target_temp = 0.0
         elif (should_be_on or burner_should_stay_on) and not burner_should_stay_off:
-            effective_max = self._get_effective_max_flow(
-                quiet_mode_active, first_block_start_time, now
-            )
-            target_temp = self._min_egress + (
-                max_demand / 100.0
-            ) * (effective_max - self._min_egress)
+            if quiet_mode_active and first_block_start_time is not None:
+                effective_max = self._get_effective_max_flow(
+                    first_block_start_time, now
+                )
+                slope = (effective_max - self._min_egress) / 100.0
+            else:
+                slope = self._egress_span_over_100
+            target_temp = self._min_egress + max_demand * slope
         else:
             # Default fallback
             target_temp = 0.0
 
-        _LOGGER.debug(
-            "Heater control: demand=%.1f%%, target=%.1f°C, cooldown=%s",
-            max_demand,
-            target_temp,
-            cooldown_active,
-        )
+        if self._debug:
+            _LOGGER.debug(
+                "Heater control: demand=%.1f%%, target=%.1f°C, cooldown=%s",
+                max_demand,
+                target_temp,
+                cooldown_active,
+            )
 
         return target_temp, cooldown_active
 
@@ -189,68 +209,53 @@ class HeaterController:
         delta_t = flow_temp - return_temp
         boiler_is_responding = flow_temp >= self._min_egress
 
-        # Determine effective threshold with hysteresis
+        # Evaluate the transitions as flat predicates and log only on
+        # edges; the hysteresis (higher exit threshold) prevents
+        # oscillation around the efficiency limit
         if self._cooldown_active:
-            # Exit cooldown if boiler is cold (not responding)
-            if not boiler_is_responding:
-                _LOGGER.info(
-                    "Exiting cooldown mode: boiler not responding (flow=%.1f°C < %.1f°C)",
-                    flow_temp,
-                    self._min_egress,
-                )
-                return False
-
-            # In cooldown - use higher threshold to exit (prevents oscillation)
             exit_threshold = MIN_EFFICIENT_DELTA_T + self._cooldown_hysteresis
-            should_exit = delta_t >= exit_threshold
-
+            should_exit = not boiler_is_responding or delta_t >= exit_threshold
             if should_exit:
                 _LOGGER.info(
-                    "Exiting cooldown mode: delta-T=%.1f°C >= %.1f°C threshold",
+                    "Exiting cooldown mode: flow=%.1f°C, delta-T=%.1f°C "
+                    "(exit threshold %.1f°C)",
+                    flow_temp,
                     delta_t,
                     exit_threshold,
                 )
-                return False
-            else:
-                return True
-        else:
-            # Not in cooldown - check if should enter
-            should_enter = (
-                heater_was_active
-                and boiler_is_responding
-                and delta_t < MIN_EFFICIENT_DELTA_T
-                and max_demand > 0
-            )
+            return not should_exit
 
-            if should_enter:
-                _LOGGER.info(
-                    "Entering cooldown mode: delta-T=%.1f°C < %.1f°C threshold",
-                    delta_t,
-                    MIN_EFFICIENT_DELTA_T,
-                )
-                return True
-            else:
-                return False
+        should_enter = (
+            heater_was_active
+            and boiler_is_responding
+            and delta_t < MIN_EFFICIENT_DELTA_T
+            and max_demand > 0
+        )
+        if should_enter:
+            _LOGGER.info(
+                "Entering cooldown mode: delta-T=%.1f°C < %.1f°C threshold",
+                delta_t,
+                MIN_EFFICIENT_DELTA_T,
+            )
+        return should_enter
 
     def _get_effective_max_flow(
         self,
-        quiet_mode_active: bool,
-        first_block_start_time: datetime | None,
+        first_block_start_time: datetime,
         now: datetime,
     ) -> float:
-        """Get the effective maximum flow temperature, accounting for quiet mode.
+        """Get the quiet-mode maximum flow temperature during the ramp.
+
+        Cold path: the caller already takes the plain max_egress fast
+        path when quiet mode is inactive.
 
         Args:
-            quiet_mode_active: Whether quiet mode is active
             first_block_start_time: When first heating block started
             now: Current time
 
         Returns:
-            Maximum flow temperature, possibly reduced for quiet mode ramp
+            Maximum flow temperature, reduced for the quiet mode ramp
         """
-        if not quiet_mode_active or first_block_start_time is None:
-            return self._max_egress
-
         # Calculate ramp progress (0.0 to 1.0)
         minutes_since_start = (now - first_block_start_time).total_seconds() / 60
         ramp_progress = min(1.0, minutes_since_start / self._quiet_mode_ramp_minutes)
@@ -261,21 +266,34 @@ class HeaterController:
         # Linear interpolation from quiet_max to max_egress
         effective_max = quiet_max + ramp_progress * (self._max_egress - quiet_max)
 
-        _LOGGER.debug(
-            "Quiet mode: %.0f%% ramp progress, effective max flow: %.1f°C",
-            ramp_progress * 100,
-            effective_max,
-        )
+        if self._debug:
+            _LOGGER.debug(
+                "Quiet mode: %.0f%% ramp progress, effective max flow: %.1f°C",
+                ramp_progress * 100,
+                effective_max,
+            )
 
         return effective_max
 
     async def set_flow_temperature(self, temperature: float) -> None:
         """Set the heater flow temperature setpoint.
 
+        Skips the service call when the requested temperature matches the
+        last successfully commanded value: under steady-state demand this
+        avoids a full service round-trip every cycle. The call itself is
+        dispatched without waiting for the heater entity to confirm, so
+        the burner state below is tracked optimistically.
+
         Args:
             temperature: Target flow temperature in °C (0 to turn off)
         """
-        await self._safe_service_call(
+        if (
+            self._last_commanded_temp is not None
+            and abs(temperature - self._last_commanded_temp) < 0.05
+        ):
+            return
+
+        success = await self._safe_service_call(
             "number",
             "set_value",
             {
@@ -283,21 +301,24 @@ class HeaterController:
                 "value": temperature,
             },
         )
-        _LOGGER.debug("Set heater to %.1f°C", temperature)
+        # Only remember the value on success so a failed call is retried
+        self._last_commanded_temp = temperature if success else None
+        if self._debug:
+            _LOGGER.debug("Set heater to %.1f°C", temperature)
 
         # Track burner state transitions
         burner_is_active = temperature > 0
 
         if burner_is_active and not self._heater_was_active:
             # Burner turning ON
-            self._burner_started_at = dt_util.now()
-            self._burner_stopped_at = None
-            _LOGGER.debug("Burner turned ON at %s", self._burner_started_at)
+            self._burner_started_mono = time.monotonic()
+            self._burner_stopped_mono = None
+            _LOGGER.debug("Burner turned ON")
         elif not burner_is_active and self._heater_was_active:
             # Burner turning OFF
-            self._burner_stopped_at = dt_util.now()
-            self._burner_started_at = None
-            _LOGGER.debug("Burner turned OFF at %s", self._burner_stopped_at)
+            self._burner_stopped_mono = time.monotonic()
+            self._burner_started_mono = None
+            _LOGGER.debug("Burner turned OFF")
 
         # Track heater state for next cycle's cooldown check
         self._heater_was_active = burner_is_active
@@ -313,22 +334,53 @@ class HeaterController:
         return self._heater_was_active
 
     async def _safe_service_call(
-        self, domain: str, service: str, data: dict[str, str | float]
+        self,
+        domain: str,
+        service: str,
+        data: dict[str, str | float],
+        blocking: bool = False,
     ) -> bool:
         """Call a service with error handling.
 
+        Non-blocking by default: the call is validated and dispatched
+        but the coordinator does not wait for the target entity's
+        round-trip. Pass blocking=True when completion matters; that
+        path is bounded by SERVICE_CALL_TIMEOUT.
+
         Args:
             domain: Service domain (e.g., "number", "climate")
             service: Service name (e.g., "set_value")
             data: Service data parameters
+            blocking: Wait for the service call to complete
 
         Returns:
-            True if service call succeeded, False otherwise
+            True if the call was dispatched (or completed, if blocking),
+            False otherwise
         """
         try:
-            await self.hass.services.async_call(domain, service, data, blocking=True)
+            if blocking:
+                # Bound the wait so a slow heater entity cannot stall
+                # the whole coordinator cycle
+                async with asyncio.timeout(SERVICE_CALL_TIMEOUT):
+                    await self.hass.services.async_call(
+                        domain, service, data, blocking=True
+                    )
+            else:
+                await self.hass.services.async_call(
+                    domain, service, data, blocking=False
+                )
             return True
-        except Exception as err:
+        except TimeoutError:
+            entity_id = data.get("entity_id", "unknown")
+            _LOGGER.warning(
+                "Service call %s.%s timed out after %.0fs for %s",
+                domain,
+                service,
+                SERVICE_CALL_TIMEOUT,
+                entity_id,
+            )
+            return False
+        except (vol.Invalid, HomeAssistantError) as err:
             entity_id = data.get("entity_id", "unknown")
             _LOGGER.error(
                 "Service call %s.%s failed for %s: %s", domain, service, entity_id, err
@@ -39,6 +39,22 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# (gain, default, min, max, step, display name, icon) per tuning entity,
+# resolved once at import time instead of per-entity dict lookups
+GAIN_SPECS: tuple[tuple[str, float, float, float, float, str, str], ...] = (
+    ("kp", DEFAULT_KP, 0, 100, 0.5, "Kp (Proportional)", "mdi:alpha-p-box"),
+    ("ki", DEFAULT_KI, 0, 2, 0.01, "Ki (Integral)", "mdi:alpha-i-box"),
+    ("kd", DEFAULT_KD, 0, 500, 5, "Kd (Derivative)", "mdi:alpha-d-box"),
+    ("ke", DEFAULT_KE, 0, 0.2, 0.005, "Ke (Outdoor)", "mdi:thermometer-lines"),
+)
+
+GAIN_DESCRIPTIONS = {
+    "kp": "Proportional gain - how aggressively to respond to current error",
+    "ki": "Integral gain - how much to compensate for accumulated error",
+    "kd": "Derivative gain - how much to dampen rapid changes",
+    "ke": "Outdoor compensation gain - boost output when cold outside",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,12 +76,9 @@ async def async_setup_entry(
     entities: list[NumberEntity] = []
 
     for zone_name in coordinator.zones:
-        entities.extend([
-            PIDGainNumber(coordinator, zone_name, "kp", DEFAULT_KP, 0, 100, 0.5),
-            PIDGainNumber(coordinator, zone_name, "ki", DEFAULT_KI, 0, 2, 0.01),
-            PIDGainNumber(coordinator, zone_name, "kd", DEFAULT_KD, 0, 500, 5),
-            PIDGainNumber(coordinator, zone_name, "ke", DEFAULT_KE, 0, 0.2, 0.005),
-        ])
+        entities.extend(
+            PIDGainNumber(coordinator, zone_name, *spec) for spec in GAIN_SPECS
+        )
 
     async_add_entities(entities)
     _LOGGER.debug("Added %d PID tuning number entities", len(entities))
@@ -86,30 +99,6 @@ class PIDGainNumber(CoordinatorEntity["EmsZoneMasterCoordinator"], NumberEntity)
     _attr_has_entity_name = True
     _attr_mode = NumberMode.BOX
 
-    # Gain configuration mapping
-    GAIN_CONFIG = {
-        "kp": {
-            "name": "Kp (Proportional)",
-            "icon": "mdi:alpha-p-box",
-            "description": "Proportional gain - how aggressively to respond to current error",
-        },
-        "ki": {
-            "name": "Ki (Integral)",
-            "icon": "mdi:alpha-i-box",
-            "description": "Integral gain - how much to compensate for accumulated error",
-        },
-        "kd": {
-            "name": "Kd (Derivative)",
-            "icon": "mdi:alpha-d-box",
-            "description": "Derivative gain - how much to dampen rapid changes",
-        },
-        "ke": {
-            "name": "Ke (Outdoor)",
-            "icon": "mdi:thermometer-lines",
-            "description": "Outdoor compensation gain - boost output when cold outside",
-        },
-    }
-
     def __init__(
         self,
         coordinator: EmsZoneMasterCoordinator,
@@ -119,6 +108,8 @@ class PIDGainNumber(CoordinatorEntity["EmsZoneMasterCoordinator"], NumberEntity)
         min_value: float,
         max_value: float,
         step: float,
+        display_name: str,
+        icon: str,
     ) -> None:
         """Initialize the number entity.
 
@@ -130,19 +121,29 @@ class PIDGainNumber(CoordinatorEntity["EmsZoneMasterCoordinator"], NumberEntity)
             min_value: Minimum allowed value
             max_value: Maximum allowed value
             step: Step size for adjustments
+            display_name: Entity display name
+            icon: Material Design icon
         """
         super().__init__(coordinator)
         self._zone_name = zone_name
         self._gain_name = gain_name
 
-        config = self.GAIN_CONFIG[gain_name]
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{zone_name}_{gain_name}"
-        self._attr_name = config["name"]
-        self._attr_icon = config["icon"]
+        self._attr_name = display_name
+        self._attr_icon = icon
         self._attr_native_min_value = min_value
         self._attr_native_max_value = max_value
         self._attr_native_step = step
         self._attr_device_info = coordinator.get_zone_device_info(zone_name)
+        # Static for the entity's lifetime; cached so HA's per-state-write
+        # attribute read does not allocate a fresh dict every tick
+        self._attr_extra_state_attributes = {
+            "description": GAIN_DESCRIPTIONS[gain_name],
+            "zone": zone_name,
+        }
+        # Last value pushed to the state machine; gains only change when
+        # a user adjusts a slider, so most coordinator ticks are no-ops
+        self._last_written_value: float | None = None
 
     @property
     def native_value(self) -> float:
@@ -176,22 +177,22 @@ class PIDGainNumber(CoordinatorEntity["EmsZoneMasterCoordinator"], NumberEntity)
             zone.pid.kd,
             zone.pid.ke,
         )
-        # Trigger immediate save
-        await self.coordinator.store.async_save()
-
-        # Trigger state update
+        # Update the UI optimistically; persistence happens in the
+        # background (debounced), so the slider never waits on disk I/O
+        self._last_written_value = getattr(zone.pid, self._gain_name)
         self.async_write_ha_state()
+        self.hass.async_create_task(
+            self.coordinator.store.async_save_debounced(),
+            name="pid_gain_save",
+        )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str]:
-        """Return additional attributes."""
-        config = self.GAIN_CONFIG[self._gain_name]
-        return {
-            "description": config["description"],
-            "zone": self._zone_name,
-        }
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        current = getattr(
+            self.coordinator.zones[self._zone_name].pid, self._gain_name
+        )
+        if current != self._last_written_value:
+            self._last_written_value = current
+            self.async_write_ha_state()
@@ -20,19 +20,72 @@ When no block is active, the default_setpoint is used.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, time, timedelta
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant, State
 
 _LOGGER = logging.getLogger(__name__)
 
 # Day name mapping (Python weekday() returns 0=Monday)
-WEEKDAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+WEEKDAY_NAMES: tuple[str, ...] = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+@lru_cache(maxsize=1024)
+def _cached_parse_time(value: str) -> time | None:
+    """Parse an ISO time string, caching the result per unique string.
+
+    Schedules reuse a handful of distinct time strings, so each one is
+    parsed exactly once for the life of the process.
+
+    Args:
+        value: Time string ("HH:MM" or "HH:MM:SS")
+
+    Returns:
+        time object or None if invalid
+    """
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _time_in_range(check: int, start: int, end: int) -> bool:
+    """Check whether a time falls in [start, end), wrapping overnight.
+
+    Operates on seconds since midnight; a range with start > end
+    (e.g. 22:00 to 06:00) is treated as crossing midnight.
+
+    Args:
+        check: Seconds since midnight to test
+        start: Range start (inclusive)
+        end: Range end (exclusive)
+
+    Returns:
+        True if check is inside the range
+    """
+    if start <= end:
+        return start <= check < end
+    return check >= start or check < end
 
 
 def _parse_temperature(value: str | float | int | None) -> float | None:
@@ -44,24 +97,25 @@ def _parse_temperature(value: str | float | int | None) -> float | None:
     Returns:
         Parsed float value, or None if parsing fails
     """
-    if value is None:
-        return None
-
-    # Already a number
-    if isinstance(value, (int, float)):
-        return float(value)
-
-    # String - handle European comma decimal separator
+    # Happy path first: almost all values arrive as int/float (or a
+    # plain numeric string), which float() handles in one C call
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        pass
+
+    # String with European comma decimal separator (e.g., "19,5")
     if isinstance(value, str):
         try:
-            # Replace comma with dot for European format (e.g., "19,5" -> "19.5")
-            normalized = value.replace(",", ".")
-            return float(normalized)
+            return float(value.replace(",", "."))
         except ValueError:
             _LOGGER.warning("Failed to parse temperature value: %s", value)
             return None
 
-    _LOGGER.warning("Unexpected temperature type: %s (%s)", value, type(value).__name__)
+    if value is not None:
+        _LOGGER.warning(
+            "Unexpected temperature type: %s (%s)", value, type(value).__name__
+        )
     return None
 
 
@@ -79,6 +133,52 @@ class ScheduleEvent(NamedTuple):
     is_active: bool
 
 
+class ScheduleSnapshot(NamedTuple):
+    """Bundle of schedule evaluation results for one point in time.
+
+    Produced by ScheduleReader.evaluate so callers that need several
+    answers (active state, setpoints, next transition) pay for a single
+    entity read instead of one per method.
+
+    Attributes:
+        is_active: Whether the schedule is currently in an active block
+        current_setpoint: Setpoint for the current time
+        time_to_next_active: Time until the next active period (0 if active)
+        next_setpoint: Setpoint of the next/current block, if known
+        time_to_next_event: Time until the next transition (start or end)
+    """
+
+    is_active: bool
+    current_setpoint: float
+    time_to_next_active: timedelta | None
+    next_setpoint: float | None
+    time_to_next_event: timedelta | None
+
+
+class DayBlocks(NamedTuple):
+    """One weekday's parsed blocks as parallel arrays.
+
+    Times are stored as integer seconds since midnight so containment
+    and ordering checks are plain int comparisons; start_times keeps
+    the original time objects for callers that need to build datetimes.
+    All arrays are sorted by start and index-aligned.
+
+    Attributes:
+        starts: Block start times in seconds since midnight
+        ends: Block end times in seconds since midnight
+        temps: Block setpoints (°C)
+        start_times: Block start times as time objects
+    """
+
+    starts: tuple[int, ...]
+    ends: tuple[int, ...]
+    temps: tuple[float, ...]
+    start_times: tuple[time, ...]
+
+
+_EMPTY_DAY_BLOCKS = DayBlocks((), (), (), ())
+
+
 class ScheduleReader:
     """Reader for Home Assistant schedule helper entities.
 
@@ -104,6 +204,31 @@ class ScheduleReader:
     # Key used in schedule data for temperature
     DATA_TEMP_KEY = "temp"
 
+    # One reader per zone; slots drop the per-instance dict and make
+    # the cache attribute loads direct
+    __slots__ = (
+        "hass",
+        "entity_id",
+        "default_setpoint",
+        "_debug",
+        "_events_cache",
+        "_events_cache_token",
+        "_transitions",
+        "_transition_keys",
+        "_transitions_token",
+        "_sorted_blocks_cache",
+        "_sorted_blocks_token",
+        "_full_schedule_cache",
+        "_full_schedule_token",
+        "_fetch_inflight",
+        "_cached_state",
+        "_cached_is_active",
+        "_cached_setpoint",
+        "_next_event_mono",
+        "_state_cache_primed",
+        "_unsub_state_listener",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -121,6 +246,181 @@ class ScheduleReader:
         self.entity_id = entity_id
         self.default_setpoint = default_setpoint
 
+        # Cached debug-enabled flag; the entity-not-found debug lines
+        # can fire every tick on a misconfigured entry, so skip their
+        # argument setup entirely when DEBUG is off
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        # Parsed per-weekday events, invalidated when the schedule entity
+        # is edited (detected via its last_updated timestamp). Repeated
+        # queries within a tick then return the cached list directly
+        # instead of re-parsing and re-sorting the day's blocks.
+        self._events_cache: dict[int, list[ScheduleEvent]] = {}
+        self._events_cache_token: datetime | None = None
+
+        # Whole-week transition table as prebuilt ScheduleEvent objects
+        # sorted by (weekday, time), with a parallel key list of
+        # seconds-since-week-start ints for bisect. Rebuilt only when
+        # the schedule entity is edited; queries are then a single
+        # O(log N) bisect over plain integers and an index into the
+        # prebuilt events, allocating nothing per call.
+        self._transitions: tuple[ScheduleEvent, ...] = ()
+        self._transition_keys: tuple[int, ...] = ()
+        self._transitions_token: datetime | None = None
+
+        # Parsed and start-sorted blocks per weekday for the
+        # full-schedule (service fetched) query paths, invalidated on
+        # schedule edits like the caches above.
+        self._sorted_blocks_cache: dict[str, DayBlocks] = {}
+        self._sorted_blocks_token: datetime | None = None
+
+        # Full schedule data fetched via the schedule.get_schedule
+        # service, cached per schedule edit (entity last_updated). The
+        # adaptive-start paths poll this every cycle but the data only
+        # changes when the user edits the helper.
+        self._full_schedule_cache: dict[str, Any] | None = None
+        self._full_schedule_token: datetime | None = None
+        # Single-flight guard: concurrent fetches within one tick share
+        # one service call instead of issuing their own
+        self._fetch_inflight: asyncio.Future[dict[str, Any] | None] | None = None
+
+        # Event-driven cache of the schedule entity's State plus the
+        # values derived from it (active flag, parsed setpoint). The
+        # listener refreshes it on change, so per-tick queries skip the
+        # state machine lookup and temp re-parsing entirely.
+        self._cached_state: State | None = None
+        self._cached_is_active: bool = False
+        self._cached_setpoint: float | None = None
+        # next_event converted once to a loop-clock deadline, so the
+        # per-tick countdown is monotonic float arithmetic instead of
+        # timezone-aware datetime subtraction
+        self._next_event_mono: float | None = None
+        self._state_cache_primed = False
+        self._unsub_state_listener: Callable[[], None] | None = (
+            async_track_state_change_event(
+                hass, [entity_id], self._handle_state_change
+            )
+        )
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Refresh the cached schedule state from a state-change event."""
+        self._refresh_state_cache(event.data.get("new_state"))
+
+    def _refresh_state_cache(self, state: State | None) -> None:
+        """Recompute the cached active flag and setpoint for a state.
+
+        Runs once per schedule state change (or on first access),
+        including the temp attribute parse, so queries between changes
+        are plain attribute reads.
+
+        Args:
+            state: New schedule entity state, or None if unavailable
+        """
+        self._cached_state = state
+        self._state_cache_primed = True
+
+        if state is None:
+            self._cached_is_active = False
+            self._cached_setpoint = None
+            self._next_event_mono = None
+            return
+
+        next_event = state.attributes.get("next_event")
+        if isinstance(next_event, datetime):
+            self._next_event_mono = (
+                self.hass.loop.time() + (next_event - dt_util.now()).total_seconds()
+            )
+        else:
+            self._next_event_mono = None
+
+        if state.state != "on":
+            self._cached_is_active = False
+            self._cached_setpoint = None
+            return
+
+        self._cached_is_active = True
+        setpoint: float | None = None
+        temp_value = state.attributes.get("temp")
+        if temp_value is not None:
+            setpoint = _parse_temperature(temp_value)
+            if setpoint is None:
+                _LOGGER.warning(
+                    "Schedule %s has invalid temp value: %s",
+                    self.entity_id,
+                    temp_value,
+                )
+        self._cached_setpoint = setpoint
+
+    def _get_state(self) -> State | None:
+        """Get the schedule entity state, from the cache once primed.
+
+        The first call fetches from the state machine; after that the
+        state-change listener keeps the cache current.
+
+        Returns:
+            Schedule entity State, or None if the entity is missing
+        """
+        if not self._state_cache_primed:
+            self._refresh_state_cache(self.hass.states.get(self.entity_id))
+        return self._cached_state
+
+    @callback
+    def async_unload(self) -> None:
+        """Detach the schedule state listener."""
+        if self._unsub_state_listener is not None:
+            self._unsub_state_listener()
+            self._unsub_state_listener = None
+
+    def evaluate(self, now: datetime | None = None) -> ScheduleSnapshot:
+        """Evaluate the full schedule state in a single entity read.
+
+        Combines is_schedule_active, get_current_setpoint,
+        get_time_to_next_active, get_next_block_setpoint and
+        get_time_to_next_event into one pass over the entity state.
+
+        Args:
+            now: Current datetime, or None to use current time (unused
+                since the next-event countdown moved to the loop clock,
+                kept for API compatibility)
+
+        Returns:
+            ScheduleSnapshot with all evaluation results
+        """
+        state = self._get_state()
+        if state is None:
+            if self._debug:
+                _LOGGER.debug("Schedule entity not found: %s", self.entity_id)
+            return ScheduleSnapshot(False, self.default_setpoint, None, None, None)
+
+        is_active = self._cached_is_active
+
+        # Current and next-block setpoint, parsed once at state change
+        current_setpoint = self.default_setpoint
+        next_setpoint: float | None = None
+        if is_active and self._cached_setpoint is not None:
+            current_setpoint = self._cached_setpoint
+            next_setpoint = self._cached_setpoint
+
+        # Next transition from the cached loop-clock deadline
+        time_to_next_event: timedelta | None = None
+        mono = self._next_event_mono
+        if mono is not None:
+            remaining = mono - self.hass.loop.time()
+            time_to_next_event = (
+                timedelta(seconds=remaining) if remaining > 0 else timedelta(0)
+            )
+
+        time_to_next_active = timedelta(0) if is_active else time_to_next_event
+
+        return ScheduleSnapshot(
+            is_active,
+            current_setpoint,
+            time_to_next_active,
+            next_setpoint,
+            time_to_next_event,
+        )
+
     def get_current_setpoint(self, now: datetime | None = None) -> float:
         """Get the setpoint for the current time.
 
@@ -133,26 +433,16 @@ class ScheduleReader:
         Returns:
             Target temperature based on schedule (°C)
         """
-        state = self.hass.states.get(self.entity_id)
+        state = self._get_state()
         if state is None:
-            _LOGGER.debug("Schedule entity not found: %s", self.entity_id)
-            return self.default_setpoint
-
-        # Check if schedule is currently active (in a time block)
-        if state.state != "on":
+            if self._debug:
+                _LOGGER.debug("Schedule entity not found: %s", self.entity_id)
             return self.default_setpoint
 
-        # Read temperature from the 'temp' attribute (HA provides this directly)
-        temp_value = state.attributes.get("temp")
-        if temp_value is not None:
-            parsed = _parse_temperature(temp_value)
-            if parsed is not None:
-                return parsed
-            _LOGGER.warning(
-                "Schedule %s has invalid temp value: %s",
-                self.entity_id,
-                temp_value,
-            )
+        # Active flag and parsed setpoint are maintained by the
+        # state-change listener; invalid temps were warned about there
+        if self._cached_is_active and self._cached_setpoint is not None:
+            return self._cached_setpoint
 
         return self.default_setpoint
 
@@ -176,12 +466,109 @@ class ScheduleReader:
 
         check_time = now.time()
 
+        for from_time, to_time, block_temp in self._normalized_blocks(
+            day_schedule, day_name
+        ):
+            if from_time <= check_time < to_time:
+                return block_temp
+
+        return None
+
+    def _normalized_blocks(
+        self, day_schedule: list[Any], day_name: str
+    ) -> Iterator[tuple[time, time, float]]:
+        """Yield valid blocks with overnight spans split at midnight.
+
+        An overnight block (from > to, e.g. 22:00 to 06:00) is emitted
+        as two same-day spans: (from, end of day) and (midnight, to).
+        Consumers can then test containment with a single
+        from <= t < to comparison instead of special-casing wraparound.
+
+        Args:
+            day_schedule: List of raw schedule blocks for one weekday
+            day_name: Weekday name, used in log messages
+
+        Yields:
+            Tuples of (from_time, to_time, block_temp), no span crossing
+            midnight
+        """
+        for from_time, to_time, block_temp in self._iter_valid_blocks(
+            day_schedule, day_name
+        ):
+            if from_time > to_time:
+                yield from_time, time.max, block_temp
+                yield time.min, to_time, block_temp
+            else:
+                yield from_time, to_time, block_temp
+
+    def _sorted_day_blocks(
+        self, day_name: str, day_blocks: list[Any]
+    ) -> DayBlocks:
+        """Get a weekday's blocks parsed into sorted parallel arrays.
+
+        Parses and sorts once per schedule edit (detected via the
+        entity's last_updated); repeat queries within that window return
+        the cached arrays.
+
+        Args:
+            day_name: Weekday name, also the cache key
+            day_blocks: Raw schedule blocks for that weekday
+
+        Returns:
+            DayBlocks with index-aligned arrays sorted by start time
+        """
+        state = self._get_state()
+        token = state.last_updated if state is not None else None
+        if token != self._sorted_blocks_token:
+            self._sorted_blocks_cache.clear()
+            self._sorted_blocks_token = token
+
+        blocks = self._sorted_blocks_cache.get(day_name)
+        if blocks is None:
+            parsed = sorted(
+                self._iter_valid_blocks(day_blocks, day_name), key=itemgetter(0)
+            )
+            if parsed:
+                blocks = DayBlocks(
+                    starts=tuple(
+                        t.hour * 3600 + t.minute * 60 + t.second
+                        for t, _to, _temp in parsed
+                    ),
+                    ends=tuple(
+                        t.hour * 3600 + t.minute * 60 + t.second
+                        for _from, t, _temp in parsed
+                    ),
+                    temps=tuple(temp for _from, _to, temp in parsed),
+                    start_times=tuple(t for t, _to, _temp in parsed),
+                )
+            else:
+                blocks = _EMPTY_DAY_BLOCKS
+            self._sorted_blocks_cache[day_name] = blocks
+        return blocks
+
+    def _iter_valid_blocks(
+        self, day_schedule: list[Any], day_name: str
+    ) -> Iterator[tuple[time, time, float]]:
+        """Yield validated (from, to, temp) tuples from a day's blocks.
+
+        Single place for block structure validation, time parsing and
+        temperature coercion; malformed blocks are logged and skipped.
+        Blocks without a temp in their data field yield the default
+        setpoint.
+
+        Args:
+            day_schedule: List of raw schedule blocks for one weekday
+            day_name: Weekday name, used in log messages
+
+        Yields:
+            Tuples of (from_time, to_time, block_temp)
+        """
         for block in day_schedule:
-            # Validate block structure
             if not isinstance(block, dict):
                 _LOGGER.warning(
-                    "Invalid schedule block type for %s: expected dict, got %s",
+                    "Invalid schedule block type for %s on %s: expected dict, got %s",
                     self.entity_id,
+                    day_name,
                     type(block).__name__,
                 )
                 continue
@@ -190,33 +577,23 @@ class ScheduleReader:
             to_time = self._parse_time(block.get("to", "00:00:00"))
 
             if from_time is None or to_time is None:
+                _LOGGER.debug(
+                    "Skipping schedule block with invalid time in %s on %s",
+                    self.entity_id,
+                    day_name,
+                )
                 continue
 
-            in_block = False
-
-            # Handle same-day blocks
-            if from_time <= check_time < to_time:
-                in_block = True
-            # Handle overnight blocks (e.g., 22:00 to 06:00)
-            elif from_time > to_time:
-                if check_time >= from_time or check_time < to_time:
-                    in_block = True
-
-            if in_block:
-                # Get temperature from block's data field
-                data = block.get("data", {})
-                if isinstance(data, dict) and self.DATA_TEMP_KEY in data:
-                    try:
-                        return float(data[self.DATA_TEMP_KEY])
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Invalid temp value in schedule data: %s",
-                            data.get(self.DATA_TEMP_KEY),
-                        )
-                # Block is active but no temp specified, use default
-                return self.default_setpoint
+            data = block.get("data", {})
+            block_temp = self.default_setpoint
+            if isinstance(data, dict) and self.DATA_TEMP_KEY in data:
+                # _parse_temperature handles comma decimals and logs
+                # its own warning on failure
+                parsed_temp = _parse_temperature(data[self.DATA_TEMP_KEY])
+                if parsed_temp is not None:
+                    block_temp = parsed_temp
 
-        return None
+            yield from_time, to_time, block_temp
 
     def get_next_event(self, now: datetime | None = None) -> ScheduleEvent | None:
         """Get the next scheduled event after the given time.
@@ -230,25 +607,106 @@ class ScheduleReader:
         if now is None:
             now = dt_util.now()
 
-        state = self._get_schedule_state()
+        state = self._get_state()
         if state is None:
+            if self._debug:
+                _LOGGER.debug("Schedule entity not found: %s", self.entity_id)
             return None
 
-        events = self._parse_schedule_events(now, state)
-        if not events:
+        transitions, keys = self._week_transitions(
+            state.attributes, state.last_updated
+        )
+        if not transitions:
             return None
 
-        current_time = now.time()
+        # First transition strictly after now, wrapping to the start of
+        # the week when the remaining days are empty. The key is integer
+        # seconds since Monday 00:00, so the bisect compares plain ints.
+        now_key = (
+            now.weekday() * 86400
+            + now.hour * 3600
+            + now.minute * 60
+            + now.second
+        )
+        idx = bisect_right(keys, now_key)
+        if idx >= len(transitions):
+            idx = 0
+        return transitions[idx]
+
+    def _week_transitions(
+        self,
+        schedule_state: dict[str, Any],
+        token: datetime,
+    ) -> tuple[tuple[ScheduleEvent, ...], tuple[int, ...]]:
+        """Get the week's transition table, rebuilding it when stale.
+
+        Returns the prebuilt events and their bisect keys as one pair so
+        callers always see a consistent snapshot: both tuples are built
+        off to the side and swapped in together, readers work from the
+        returned references and never touch the instance attributes
+        mid-rebuild.
+
+        Args:
+            schedule_state: Schedule entity attributes
+            token: Entity last_updated, used to detect schedule edits
+
+        Returns:
+            Pair of (transitions, keys) where transitions holds
+            ScheduleEvent objects sorted by weekday and time, and keys
+            holds the matching seconds-since-week-start ints
+        """
+        if self._transitions and token == self._transitions_token:
+            return self._transitions, self._transition_keys
+
+        # Unpack the NamedTuple fields positionally; plain tuple
+        # unpacking skips the per-field descriptor lookups
+        transitions_list = [
+            (weekday, event_time, is_active, setpoint)
+            for weekday in range(7)
+            for event_time, setpoint, is_active in self._day_events(
+                weekday, schedule_state, token
+            )
+        ]
+        transitions_list.sort(key=itemgetter(0, 1))
+
+        transitions = tuple(
+            ScheduleEvent(time=t, setpoint=setpoint, is_active=is_active)
+            for _weekday, t, is_active, setpoint in transitions_list
+        )
+        keys = tuple(
+            weekday * 86400 + t.hour * 3600 + t.minute * 60 + t.second
+            for weekday, t, _active, _setpoint in transitions_list
+        )
+        self._transitions = transitions
+        self._transition_keys = keys
+        self._transitions_token = token
+        return transitions, keys
+
+    def _day_events(
+        self,
+        weekday: int,
+        schedule_state: dict[str, Any],
+        token: datetime,
+    ) -> list[ScheduleEvent]:
+        """Get the parsed events for a weekday, using the cache when valid.
 
-        # Find the next event after current time
-        for event in events:
-            if event.time > current_time:
-                return event
+        Args:
+            weekday: Weekday index (0=Monday)
+            schedule_state: Schedule entity attributes
+            token: Entity last_updated, used to detect schedule edits
 
-        # If no event found today, check tomorrow
-        tomorrow = now + timedelta(days=1)
-        tomorrow_events = self._parse_schedule_events(tomorrow, state)
-        return tomorrow_events[0] if tomorrow_events else None
+        Returns:
+            List of schedule events sorted by time
+        """
+        if token != self._events_cache_token:
+            self._events_cache.clear()
+            self._events_cache_token = token
+
+        events = self._events_cache.get(weekday)
+        if events is None:
+            events = self._parse_day_events(weekday, schedule_state)
+            self._events_cache[weekday] = events
+        return events
 
     def get_time_to_next_active(self, now: datetime | None = None) -> timedelta | None:
         """Get time until the next schedule activation (start of heating period).
@@ -256,34 +714,20 @@ class ScheduleReader:
         Uses HA's next_event attribute when schedule is currently off.
 
         Args:
-            now: Current datetime, or None to use current time
+            now: Current datetime, or None to use current time (unused,
+                kept for API compatibility)
 
         Returns:
             Time until next active period starts, or None if no schedule
         """
-        if now is None:
-            now = dt_util.now()
-
-        state = self.hass.states.get(self.entity_id)
-        if state is None:
+        if self._get_state() is None:
             return None
 
         # If schedule is already active, return 0
-        if state.state == "on":
+        if self._cached_is_active:
             return timedelta(0)
 
-        # Use HA's next_event attribute for the next transition
-        next_event = state.attributes.get("next_event")
-        if next_event is None:
-            return None
-
-        # next_event is already a datetime object from HA
-        if isinstance(next_event, datetime):
-            if next_event > now:
-                return next_event - now
-            return timedelta(0)
-
-        return None
+        return self._read_next_event()
 
     def get_time_to_next_event(self, now: datetime | None = None) -> timedelta | None:
         """Get time until the next scheduled event (start or end).
@@ -291,30 +735,33 @@ class ScheduleReader:
         Uses HA's next_event attribute directly.
 
         Args:
-            now: Current datetime, or None to use current time
+            now: Current datetime, or None to use current time (unused,
+                kept for API compatibility)
 
         Returns:
             Time until next event, or None if no schedule
         """
-        if now is None:
-            now = dt_util.now()
+        return self._read_next_event()
 
-        state = self.hass.states.get(self.entity_id)
-        if state is None:
-            return None
+    def _read_next_event(self) -> timedelta | None:
+        """Read the time to the next transition from the cached deadline.
 
-        # Use HA's next_event attribute
-        next_event = state.attributes.get("next_event")
-        if next_event is None:
+        Shared by get_time_to_next_active, get_time_to_next_event and
+        evaluate. The deadline was converted to the loop clock when the
+        state last changed, so this is a float subtraction.
+
+        Returns:
+            Time until the next transition, or None if unavailable
+        """
+        if self._get_state() is None:
             return None
 
-        # next_event is already a datetime object from HA
-        if isinstance(next_event, datetime):
-            if next_event > now:
-                return next_event - now
-            return timedelta(0)
+        mono = self._next_event_mono
+        if mono is None:
+            return None
 
-        return None
+        remaining = mono - self.hass.loop.time()
+        return timedelta(seconds=remaining) if remaining > 0 else timedelta(0)
 
     def _get_schedule_state(self) -> dict[str, Any] | None:
         """Get the current state of the schedule entity.
@@ -324,24 +771,19 @@ class ScheduleReader:
         (state, temp, next_event) instead.
 
         Returns:
-            Schedule state attributes, or None if entity not found or invalid
+            Schedule state attributes, or None if entity not found
         """
-        try:
-            state = self.hass.states.get(self.entity_id)
-            if state is None:
+        state = self._get_state()
+        if state is None:
+            if self._debug:
                 _LOGGER.debug("Schedule entity not found: %s", self.entity_id)
-                return None
-
-            # Schedule entities store their config in attributes
-            return dict(state.attributes)
-        except Exception as err:
-            _LOGGER.error(
-                "Error reading schedule entity %s: %s",
-                self.entity_id,
-                err,
-            )
             return None
 
+        # Schedule entities store their config in attributes. The mapping
+        # is read-only for all callers, so hand out the state's own
+        # attribute view instead of shallow-copying the weekday lists.
+        return state.attributes
+
     def _is_time_in_schedule(self, now: datetime, schedule_state: dict[str, Any]) -> bool:
         """Check if a datetime falls within active schedule blocks.
 
@@ -354,61 +796,30 @@ class ScheduleReader:
         """
         return self._get_block_temperature(now, schedule_state) is not None
 
-    def _parse_schedule_events(
-        self, date: datetime, schedule_state: dict[str, Any]
+    def _parse_day_events(
+        self, weekday: int, schedule_state: dict[str, Any]
     ) -> list[ScheduleEvent]:
-        """Parse schedule into a list of events for a specific date.
+        """Parse schedule into a list of events for a weekday.
 
         Each time block generates two events: start (is_active=True) and
-        end (is_active=False).
+        end (is_active=False). Cold path - results are cached per weekday
+        by _day_events.
 
         Args:
-            date: Date to parse schedule for
+            weekday: Weekday index (0=Monday)
             schedule_state: Schedule entity attributes
 
         Returns:
             List of schedule events sorted by time
         """
-        day_name = WEEKDAY_NAMES[date.weekday()]
+        day_name = WEEKDAY_NAMES[weekday]
         day_schedule = schedule_state.get(day_name, [])
 
         events: list[ScheduleEvent] = []
 
-        for block in day_schedule:
-            # Validate block structure
-            if not isinstance(block, dict):
-                _LOGGER.warning(
-                    "Invalid schedule block type for %s on %s: expected dict, got %s",
-                    self.entity_id,
-                    day_name,
-                    type(block).__name__,
-                )
-                continue
-
-            from_time = self._parse_time(block.get("from", "00:00:00"))
-            to_time = self._parse_time(block.get("to", "00:00:00"))
-
-            if from_time is None or to_time is None:
-                _LOGGER.debug(
-                    "Skipping schedule block with invalid time in %s on %s",
-                    self.entity_id,
-                    day_name,
-                )
-                continue
-
-            # Get temperature from block's data field
-            data = block.get("data", {})
-            block_temp = self.default_setpoint
-            if isinstance(data, dict) and self.DATA_TEMP_KEY in data:
-                try:
-                    block_temp = float(data[self.DATA_TEMP_KEY])
-                except (ValueError, TypeError):
-                    _LOGGER.warning(
-                        "Invalid temp value in schedule block data for %s: %s",
-                        self.entity_id,
-                        data.get(self.DATA_TEMP_KEY),
-                    )
-
+        for from_time, to_time, block_temp in self._iter_valid_blocks(
+            day_schedule, day_name
+        ):
             # Start of active period
             events.append(ScheduleEvent(
                 time=from_time,
@@ -428,8 +839,8 @@ class ScheduleReader:
                 is_active=False,
             ))
 
-        # Sort by time
-        events.sort(key=lambda e: e.time)
+        # Sort by time (field 0); itemgetter keeps the key in C
+        events.sort(key=itemgetter(0))
         return events
 
     def _parse_time(self, time_value: str | time) -> time | None:
@@ -450,19 +861,10 @@ class ScheduleReader:
             _LOGGER.warning("Invalid time type: %s (%s)", time_value, type(time_value).__name__)
             return None
 
-        try:
-            if len(time_value) == 8:  # HH:MM:SS
-                parts = time_value.split(":")
-                return time(int(parts[0]), int(parts[1]), int(parts[2]))
-            elif len(time_value) == 5:  # HH:MM
-                parts = time_value.split(":")
-                return time(int(parts[0]), int(parts[1]))
-            else:
-                _LOGGER.warning("Invalid time format: %s", time_value)
-                return None
-        except (ValueError, IndexError) as err:
-            _LOGGER.warning("Failed to parse time '%s': %s", time_value, err)
-            return None
+        parsed = _cached_parse_time(time_value)
+        if parsed is None:
+            _LOGGER.warning("Failed to parse time: %s", time_value)
+        return parsed
 
     def is_schedule_active(self, now: datetime | None = None) -> bool:
         """Check if the schedule is currently in an active period.
@@ -475,11 +877,9 @@ class ScheduleReader:
         Returns:
             True if currently in a scheduled block (not in default/off period)
         """
-        state = self.hass.states.get(self.entity_id)
-        if state is None:
-            return False
-
-        return state.state == "on"
+        # Primes the cache on first use; the listener keeps it current
+        self._get_state()
+        return self._cached_is_active
 
     async def get_next_block_setpoint_async(self, now: datetime | None = None) -> float | None:
         """Get the setpoint of the next scheduled block (async version).
@@ -516,37 +916,66 @@ class ScheduleReader:
         Returns:
             Temperature of current active block, or None if schedule is off
         """
-        state = self.hass.states.get(self.entity_id)
+        state = self._get_state()
         if state is None:
             return None
 
-        # If schedule is active, return current temp
-        if state.state == "on":
-            temp_value = state.attributes.get("temp")
-            if temp_value is not None:
-                return _parse_temperature(temp_value)
+        # If schedule is active, return the cached parsed temp
+        if self._cached_is_active:
+            return self._cached_setpoint
 
         return None
 
     async def _fetch_full_schedule(self) -> dict[str, Any] | None:
         """Fetch full schedule data via schedule.get_schedule service.
 
+        The response is cached keyed on the entity's last_updated, so
+        the service round-trip runs once per schedule edit instead of
+        once per adaptive-start poll.
+
         Returns:
             Full schedule with weekday blocks, or None if unavailable
         """
+        state = self._get_state()
+        token = state.last_updated if state is not None else None
+        if (
+            self._full_schedule_cache is not None
+            and token is not None
+            and token == self._full_schedule_token
+        ):
+            return self._full_schedule_cache
+
+        # Coalesce concurrent callers onto the in-flight service call
+        if self._fetch_inflight is not None:
+            return await self._fetch_inflight
+
+        future: asyncio.Future[dict[str, Any] | None] = self.hass.loop.create_future()
+        self._fetch_inflight = future
+
+        schedule_data: dict[str, Any] | None = None
         try:
-            response = await self.hass.services.async_call(
-                "schedule",
-                "get_schedule",
-                {"entity_id": self.entity_id},
-                blocking=True,
-                return_response=True,
-            )
-            if response and self.entity_id in response:
-                return response[self.entity_id]
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch schedule data for %s: %s", self.entity_id, err)
-        return None
+            try:
+                response = await self.hass.services.async_call(
+                    "schedule",
+                    "get_schedule",
+                    {"entity_id": self.entity_id},
+                    blocking=True,
+                    return_response=True,
+                )
+                if response and self.entity_id in response:
+                    schedule_data = response[self.entity_id]
+                    if token is not None:
+                        self._full_schedule_cache = schedule_data
+                        self._full_schedule_token = token
+            except Exception as err:
+                _LOGGER.warning(
+                    "Failed to fetch schedule data for %s: %s", self.entity_id, err
+                )
+        finally:
+            self._fetch_inflight = None
+            future.set_result(schedule_data)
+
+        return schedule_data
 
     def _find_next_block_temp(
         self, now: datetime, schedule_data: dict[str, Any]
@@ -560,7 +989,7 @@ class ScheduleReader:
         Returns:
             Temperature of next block, or None if not found
         """
-        current_time = now.time()
+        current_s = now.hour * 3600 + now.minute * 60 + now.second
 
         # Check today first, then tomorrow
         for day_offset in range(2):
@@ -571,27 +1000,16 @@ class ScheduleReader:
             if not day_blocks:
                 continue
 
-            # Sort blocks by start time
-            sorted_blocks = sorted(
-                day_blocks,
-                key=lambda b: self._parse_time(b.get("from", "99:99:99")) or time(23, 59, 59)
-            )
-
-            for block in sorted_blocks:
-                from_time = self._parse_time(block.get("from", "00:00:00"))
-                if from_time is None:
-                    continue
-
-                # For today, only consider blocks that start after current time
-                # For tomorrow, consider all blocks
-                if day_offset == 0 and from_time <= current_time:
-                    continue
+            blocks = self._sorted_day_blocks(day_name, day_blocks)
+            if not blocks.starts:
+                continue
 
-                # Found the next block - get its temperature
-                data = block.get("data", {})
-                if isinstance(data, dict) and self.DATA_TEMP_KEY in data:
-                    return _parse_temperature(data[self.DATA_TEMP_KEY])
-                return self.default_setpoint
+            # Today: first block starting strictly after now; tomorrow:
+            # its first block. The starts array is sorted, so this is a
+            # single bisect instead of a scan.
+            idx = bisect_right(blocks.starts, current_s) if day_offset == 0 else 0
+            if idx < len(blocks.starts):
+                return blocks.temps[idx]
 
         return None
 
@@ -610,8 +1028,8 @@ class ScheduleReader:
             now = dt_util.now()
 
         # Must be in an active schedule block
-        state = self.hass.states.get(self.entity_id)
-        if state is None or state.state != "on":
+        state = self._get_state()
+        if state is None or not self._cached_is_active:
             return False
 
         schedule_data = await self._fetch_full_schedule()
@@ -636,31 +1054,12 @@ class ScheduleReader:
         if not day_blocks:
             return False
 
-        # Sort blocks by start time to find the first one
-        sorted_blocks = sorted(
-            day_blocks,
-            key=lambda b: self._parse_time(b.get("from", "99:99:99")) or time(23, 59, 59)
-        )
-
-        first_block = sorted_blocks[0]
-        from_time = self._parse_time(first_block.get("from", "00:00:00"))
-        to_time = self._parse_time(first_block.get("to", "00:00:00"))
-
-        if from_time is None or to_time is None:
+        blocks = self._sorted_day_blocks(day_name, day_blocks)
+        if not blocks.starts:
             return False
 
-        current_time = now.time()
-
-        # Check if we're in this first block
-        if from_time <= current_time < to_time:
-            return True
-
-        # Handle overnight blocks
-        if from_time > to_time:
-            if current_time >= from_time or current_time < to_time:
-                return True
-
-        return False
+        current_s = now.hour * 3600 + now.minute * 60 + now.second
+        return _time_in_range(current_s, blocks.starts[0], blocks.ends[0])
 
     async def get_first_block_start_time_async(self, now: datetime | None = None) -> datetime | None:
         """Get the start time of today's first schedule block.
@@ -686,17 +1085,9 @@ class ScheduleReader:
         if not day_blocks:
             return None
 
-        # Sort blocks by start time
-        sorted_blocks = sorted(
-            day_blocks,
-            key=lambda b: self._parse_time(b.get("from", "99:99:99")) or time(23, 59, 59)
-        )
-
-        first_block = sorted_blocks[0]
-        from_time = self._parse_time(first_block.get("from", "00:00:00"))
-
-        if from_time is None:
+        blocks = self._sorted_day_blocks(day_name, day_blocks)
+        if not blocks.start_times:
             return None
 
         # Combine with today's date
-        return datetime.combine(now.date(), from_time, tzinfo=now.tzinfo)
+        return datetime.combine(now.date(), blocks.start_times[0], tzinfo=now.tzinfo)
@@ -10,7 +10,7 @@ Provides sensors for:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -66,7 +66,36 @@ async def async_setup_entry(
     _LOGGER.debug("Added %d sensor entities", len(entities))
 
 
-class TimeToTargetSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEntity):
+class EmsZoneMasterSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEntity):
+    """Base class for the integration's sensors.
+
+    Skips the state-machine write on coordinator ticks where neither
+    the value nor the attributes changed; with steady demand most ticks
+    produce identical readings across every sensor.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: EmsZoneMasterCoordinator) -> None:
+        """Initialize the sensor.
+
+        Args:
+            coordinator: Data coordinator
+        """
+        super().__init__(coordinator)
+        self._last_written: tuple[Any, Any] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the emitted value or attributes moved."""
+        new = (self.native_value, self.extra_state_attributes)
+        if new == self._last_written:
+            return
+        self._last_written = new
+        self.async_write_ha_state()
+
+
+class TimeToTargetSensor(EmsZoneMasterSensor):
     """Sensor showing estimated time to reach target temperature.
 
     Uses the zone's learned warmup factor to estimate how long
@@ -79,7 +108,6 @@ class TimeToTargetSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEn
         _zone_name: Name of the zone this sensor represents
     """
 
-    _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
@@ -98,51 +126,79 @@ class TimeToTargetSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEn
         """
         super().__init__(coordinator)
         self._zone_name = zone_name
+        # Zone objects live as long as the coordinator and are mutated
+        # in place, so the reference can be resolved once
+        self._zone = coordinator.zones[zone_name]
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{zone_name}_time_to_target"
         self._attr_name = "Time to Target"
         self._attr_device_info = coordinator.get_zone_device_info(zone_name)
+        # State is computed once per coordinator tick; the properties
+        # just hand back the cached results however often HA reads them
+        self._cached_value, self._last_attr_key = self._compute_state()
+        self._last_attr_dict = self._build_attrs(self._last_attr_key)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return estimated minutes to reach target temperature.
+    def _compute_state(
+        self,
+    ) -> tuple[float | None, tuple[float, float, float | None, bool, bool]]:
+        """Read the zone once and derive value plus attribute key.
 
-        Returns None if:
-        - Current temperature is unknown
-        - Zone is already at or above setpoint
+        The value is None while the current temperature is unknown and
+        0 when the zone is already at or above setpoint; otherwise the
+        estimate from the learned warmup factor. Display rounding is
+        handled by suggested_display_precision.
         """
-        zone = self.coordinator.zones[self._zone_name]
-
-        if zone.current_temp is None:
-            return None
-
-        temp_delta = zone.setpoint - zone.current_temp
-
-        if temp_delta <= 0:
-            # Already at or above setpoint
-            return 0
-
-        # Estimate based on learned warmup factor
-        return round(temp_delta * zone.warmup_factor, 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, float | bool | None]:
-        """Return additional attributes."""
-        zone = self.coordinator.zones[self._zone_name]
+        zone = self._zone
+        current = zone.current_temp
+        if current is None:
+            value = None
+        else:
+            temp_delta = zone.setpoint - current
+            value = 0.0 if temp_delta <= 0 else temp_delta * zone.warmup_factor
+        return value, (
+            zone.warmup_factor,
+            zone.setpoint,
+            current,
+            zone.adaptive_start_active,
+            zone.sync_forced,
+        )
+
+    @staticmethod
+    def _build_attrs(
+        key: tuple[float, float, float | None, bool, bool],
+    ) -> dict[str, float | bool | None]:
+        """Build the attribute dict for a computed key tuple."""
         return {
-            "warmup_factor": zone.warmup_factor,
-            "setpoint": zone.setpoint,
-            "current_temp": zone.current_temp,
-            "adaptive_start": zone.adaptive_start_active,
-            "sync_forced": zone.sync_forced,
+            "warmup_factor": key[0],
+            "setpoint": key[1],
+            "current_temp": key[2],
+            "adaptive_start": key[3],
+            "sync_forced": key[4],
         }
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Recompute once per tick; write only when something moved."""
+        value, key = self._compute_state()
+        if value == self._cached_value and key == self._last_attr_key:
+            return
+        self._cached_value = value
+        if key != self._last_attr_key:
+            self._last_attr_key = key
+            self._last_attr_dict = self._build_attrs(key)
         self.async_write_ha_state()
 
+    @property
+    def native_value(self) -> float | None:
+        """Return estimated minutes to reach target temperature."""
+        return self._cached_value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | bool | None]:
+        """Return additional attributes."""
+        return self._last_attr_dict
+
 
-class MasterStatusSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEntity):
+class MasterStatusSensor(EmsZoneMasterSensor):
     """Sensor showing overall heating system status.
 
     Displays one of:
@@ -152,7 +208,6 @@ class MasterStatusSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEn
     - solar_limited: Reduced output due to solar power
     """
 
-    _attr_has_entity_name = True
     _attr_name = "Master Status"
     _attr_icon = "mdi:radiator"
 
@@ -161,6 +216,8 @@ class MasterStatusSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEn
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_master_status"
         self._attr_device_info = coordinator.device_info
+        self._last_attr_key: tuple[float, float, bool, bool] | None = None
+        self._last_attr_dict: dict[str, float | bool] = {}
 
     @property
     def native_value(self) -> str:
@@ -178,28 +235,35 @@ class MasterStatusSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEn
 
     @property
     def extra_state_attributes(self) -> dict[str, float | bool]:
-        """Return additional status information."""
-        return {
-            "max_demand": round(self.coordinator.max_demand, 1),
-            "target_flow_temp": round(self.coordinator.target_flow_temp, 1),
-            "cooldown_active": self.coordinator.cooldown_active,
-            "solar_limited": self.coordinator.solar_limited,
-        }
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        """Return additional status information.
 
-
-class TargetFlowTempSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEntity):
+        HA reads this on every state write; rebuild the dict only when
+        one of the four values actually moved.
+        """
+        key = (
+            round(self.coordinator.max_demand, 1),
+            round(self.coordinator.target_flow_temp, 1),
+            self.coordinator.cooldown_active,
+            self.coordinator.solar_limited,
+        )
+        if key != self._last_attr_key:
+            self._last_attr_key = key
+            self._last_attr_dict = {
+                "max_demand": key[0],
+                "target_flow_temp": key[1],
+                "cooldown_active": key[2],
+                "solar_limited": key[3],
+            }
+        return self._last_attr_dict
+
+
+class TargetFlowTempSensor(EmsZoneMasterSensor):
     """Sensor showing the target flow temperature.
 
     Displays the calculated flow temperature setpoint that will be
     sent to the heater based on the current demand.
     """
 
-    _attr_has_entity_name = True
     _attr_name = "Target Flow Temperature"
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -216,22 +280,16 @@ class TargetFlowTempSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], Sensor
     @property
     def native_value(self) -> float:
         """Return target flow temperature."""
-        return round(self.coordinator.target_flow_temp, 1)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        return self.coordinator.target_flow_temp
 
 
-class TotalDemandSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEntity):
+class TotalDemandSensor(EmsZoneMasterSensor):
     """Sensor showing the total/maximum heating demand.
 
     Displays the highest demand value from all zones,
     which determines the target flow temperature.
     """
 
-    _attr_has_entity_name = True
     _attr_name = "Total Demand"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "%"
@@ -243,21 +301,26 @@ class TotalDemandSensor(CoordinatorEntity["EmsZoneMasterCoordinator"], SensorEnt
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_total_demand"
         self._attr_device_info = coordinator.device_info
+        # Attribute keys never change; build the f-strings once
+        self._zones = tuple(coordinator.zones.values())
+        self._demand_keys = tuple(f"{name}_demand" for name in coordinator.zones)
+        self._last_attr_key: tuple[float, ...] | None = None
+        self._last_attr_dict: dict[str, float] = {}
 
     @property
     def native_value(self) -> float:
         """Return maximum demand across all zones."""
-        return round(self.coordinator.max_demand, 0)
+        return self.coordinator.max_demand
 
     @property
     def extra_state_attributes(self) -> dict[str, float]:
-        """Return per-zone demand breakdown."""
-        return {
-            f"{name}_demand": round(zone.demand, 1)
-            for name, zone in self.coordinator.zones.items()
-        }
+        """Return per-zone demand breakdown.
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        The dict is rebuilt only when a rounded zone demand changed;
+        between changes HA gets the cached dict back.
+        """
+        key = tuple(round(zone.demand, 1) for zone in self._zones)
+        if key != self._last_attr_key:
+            self._last_attr_key = key
+            self._last_attr_dict = dict(zip(self._demand_keys, key))
+        return self._last_attr_dict
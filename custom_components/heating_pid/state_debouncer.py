@@ -6,35 +6,40 @@ presence sensors, and manual setpoints.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from dataclasses import dataclass
-from datetime import datetime  # Used for type hints in PendingChange
-from typing import Awaitable, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event
+    from homeassistant.helpers.event import EventStateChangedData
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingChange:
     """Represents a pending state change awaiting debounce confirmation.
 
+    One instance is allocated per tracked entity and mutated in place
+    for each detected change; ``cancel_timer is None`` means no change
+    is currently pending.
+
     Attributes:
         new_state: The new state value
-        detected_at: When the state change was first detected
         delay_seconds: How long to wait before confirming
-        callback: Async function to call when change is confirmed
         cancel_timer: Function to cancel the debounce timer
     """
 
     new_state: str
-    detected_at: datetime
     delay_seconds: float
-    callback: Callable[[], Awaitable[None]]
     cancel_timer: Callable[[], None] | None = None
 
 
@@ -59,6 +64,8 @@ class StateDebouncer:
         """
         self._hass = hass
         self._pending: dict[str, PendingChange] = {}
+        self._prev_states: dict[str, str | None] = {}
+        self._on_confirmed: dict[str, Callable[[str], Awaitable[None]]] = {}
         self._unsub_listeners: list[Callable[[], None]] = []
 
     def track_entity(
@@ -75,47 +82,44 @@ class StateDebouncer:
             on_confirmed: Async callback when change is confirmed
         """
         @callback
-        async def _state_listener(event: str | None = None) -> None:
+        def _state_listener(event: Event[EventStateChangedData]) -> None:
             """Handle state change events."""
-            state = self._hass.states.get(entity_id)
+            # The event already carries the new state; no need to hit
+            # the state machine again
+            state = event.data.get("new_state")
             if state is None:
                 return
 
             new_state_value = state.state
-            now = dt_util.now()
+            pending = self._pending[entity_id]
 
             # Check if there's a pending change
-            if entity_id in self._pending:
-                pending = self._pending[entity_id]
-
-                # If state reverted to original, cancel pending change
-                if new_state_value == pending.new_state:
-                    # State changed again, ignore
-                    pass
-                elif new_state_value == self._get_previous_state(entity_id):
-                    # State reverted, cancel pending
+            if pending.cancel_timer is not None:
+                if new_state_value == self._prev_states.get(entity_id):
+                    # State reverted to original, cancel pending
                     _LOGGER.debug(
                         "State reverted for %s to %s, canceling pending change",
                         entity_id,
                         new_state_value,
                     )
-                    if pending.cancel_timer:
-                        pending.cancel_timer()
-                    del self._pending[entity_id]
-
-                # Same as new state, reset timer
-                if pending.new_state == new_state_value:
-                    if pending.cancel_timer:
-                        pending.cancel_timer()
-
-                    # Schedule new timer
-                    pending.cancel_timer = self._schedule_confirmation(
-                        entity_id, pending, now
-                    )
+                    pending.cancel_timer()
+                    pending.cancel_timer = None
+                    return
+
+                if new_state_value != pending.new_state:
+                    # Different target while pending: retarget, then
+                    # restart the debounce window below
+                    pending.new_state = new_state_value
+
+                # Same (or retargeted) state, reset timer
+                pending.cancel_timer()
+                pending.cancel_timer = self._schedule_confirmation(
+                    entity_id, pending
+                )
                 return
 
             # Store previous state
-            previous = getattr(self, f"_prev_state_{entity_id}", None)
+            previous = self._prev_states.get(entity_id)
 
             # Only trigger on actual changes
             if new_state_value != previous:
@@ -127,22 +131,22 @@ class StateDebouncer:
                     delay_seconds,
                 )
 
-                # Create pending change
-                change = PendingChange(
-                    new_state=new_state_value,
-                    detected_at=now,
-                    delay_seconds=delay_seconds,
-                    callback=lambda: on_confirmed(new_state_value),
+                # Reuse the per-entity object; only the target state
+                # changes between events
+                pending.new_state = new_state_value
+                pending.cancel_timer = self._schedule_confirmation(
+                    entity_id, pending
                 )
 
-                # Schedule confirmation
-                change.cancel_timer = self._schedule_confirmation(
-                    entity_id, change, now
-                )
-                self._pending[entity_id] = change
-
-        # Track previous state
-        setattr(self, f"_prev_state_{entity_id}", None)
+        # Track previous state and preallocate the entity's single
+        # PendingChange; the confirmation handler looks up on_confirmed
+        # by entity id and passes the target that was actually confirmed
+        self._prev_states.setdefault(entity_id, None)
+        self._on_confirmed[entity_id] = on_confirmed
+        self._pending[entity_id] = PendingChange(
+            new_state="",
+            delay_seconds=delay_seconds,
+        )
 
         # Subscribe to state changes using proper HA event tracking
         self._unsub_listeners.append(
@@ -154,27 +158,22 @@ class StateDebouncer:
         # Set initial state
         state = self._hass.states.get(entity_id)
         if state is not None:
-            setattr(self, f"_prev_state_{entity_id}", state.state)
-
-    def _get_previous_state(self, entity_id: str) -> str | None:
-        """Get the previously stored state for an entity."""
-        return getattr(self, f"_prev_state_{entity_id}", None)
+            self._prev_states[entity_id] = state.state
 
     def _schedule_confirmation(
-        self, entity_id: str, change: PendingChange, now: datetime
+        self, entity_id: str, change: PendingChange
     ) -> Callable[[], None]:
         """Schedule a callback to confirm the state change.
 
         Args:
             entity_id: Entity being tracked
             change: Pending change info
-            now: Current time
 
         Returns:
             Function to cancel the scheduled callback
         """
 
-        async def _confirm_callback():
+        async def _confirm_callback(_fire_time: datetime) -> None:
             try:
                 # Verify state hasn't changed
                 current = self._hass.states.get(entity_id)
@@ -188,36 +187,28 @@ class StateDebouncer:
                         change.new_state,
                     )
                     # Update previous state
-                    setattr(self, f"_prev_state_{entity_id}", change.new_state)
-                    # Call callback
-                    await change.callback()
-                    # Clear pending
-                    del self._pending[entity_id]
+                    self._prev_states[entity_id] = change.new_state
+                    # Clear pending before the callback so a re-entrant
+                    # state change is treated as a fresh detection
+                    change.cancel_timer = None
+                    await self._on_confirmed[entity_id](change.new_state)
                 else:
                     _LOGGER.debug(
                         "State changed again for %s, re-scheduling",
                         entity_id,
                     )
-                    # State changed again, reschedule
-                    change_new = PendingChange(
-                        new_state=current.state,
-                        detected_at=dt_util.now(),
-                        delay_seconds=change.delay_seconds,
-                        callback=change.callback,
+                    # State changed again, retarget and reschedule
+                    change.new_state = current.state
+                    change.cancel_timer = self._schedule_confirmation(
+                        entity_id, change
                     )
-                    change_new.cancel_timer = self._schedule_confirmation(
-                        entity_id, change_new, dt_util.now()
-                    )
-                    self._pending[entity_id] = change_new
 
             except Exception as err:
                 _LOGGER.error("Error in state confirmation callback: %s", err)
 
-        # Schedule the callback using HA's event loop
-        timer_handle = self._hass.loop.call_later(
-            change.delay_seconds, lambda: asyncio.create_task(_confirm_callback())
-        )
-        return timer_handle.cancel
+        # Schedule through HA's helper: one cancelable handle, no
+        # lambda-plus-create_task indirection per state change
+        return async_call_later(self._hass, change.delay_seconds, _confirm_callback)
 
     def cancel_pending(self, entity_id: str) -> None:
         """Cancel any pending state change for an entity.
@@ -225,18 +216,17 @@ class StateDebouncer:
         Args:
             entity_id: Entity to cancel pending change for
         """
-        if entity_id in self._pending:
-            pending = self._pending[entity_id]
-            if pending.cancel_timer:
-                pending.cancel_timer()
-            del self._pending[entity_id]
+        pending = self._pending.get(entity_id)
+        if pending is not None and pending.cancel_timer is not None:
+            pending.cancel_timer()
+            pending.cancel_timer = None
             _LOGGER.debug("Canceled pending state change for %s", entity_id)
 
     def shutdown(self) -> None:
         """Cancel all pending changes and listeners."""
         # Cancel all pending timers
         for change in self._pending.values():
-            if change.cancel_timer:
+            if change.cancel_timer is not None:
                 change.cancel_timer()
         self._pending.clear()
 
@@ -244,4 +234,5 @@ class StateDebouncer:
         for unsub in self._unsub_listeners:
             unsub()
         self._unsub_listeners.clear()
+        self._on_confirmed.clear()
         _LOGGER.debug("State debouncer shutdown complete")
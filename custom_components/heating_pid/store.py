@@ -10,10 +10,14 @@ The store is loaded on integration startup and saved periodically
 
 from __future__ import annotations
 
+import json
 import logging
+import zlib
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.storage import Store
 
 from .const import STORAGE_KEY, STORAGE_VERSION
@@ -35,7 +39,10 @@ class EmsZoneMasterStore:
     Attributes:
         hass: Home Assistant instance
         _store: HA storage helper
-        _data: Current stored data dictionary
+        _warmup: Warmup factors keyed by zone name
+        _integrals: PID integrals keyed by zone name
+        _setpoints: Manual setpoints keyed by zone name
+        _gains: PID gain dicts keyed by zone name
     """
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -48,12 +55,29 @@ class EmsZoneMasterStore:
         self._store: Store[dict[str, Any]] = Store(
             hass, STORAGE_VERSION, STORAGE_KEY
         )
-        self._data: dict[str, Any] = {
-            "warmup_factors": {},
-            "pid_integrals": {},
-            "manual_setpoints": {},
-            "pid_gains": {},
-        }
+        # Dedicated sub-dicts instead of one nested blob: the getters sit
+        # on the per-tick PID path and a single dict lookup beats
+        # self._data.get("...", {}).get(zone_name)
+        self._warmup: dict[str, float] = {}
+        self._integrals: dict[str, float] = {}
+        self._setpoints: dict[str, float] = {}
+        self._gains: dict[str, dict[str, float]] = {}
+        # Set by every mutator; async_save skips the disk write when the
+        # data has not changed since the last save
+        self._dirty = False
+        # CRC of the last payload written; catches mutators that set the
+        # dirty flag with byte-identical values (e.g. a re-learned warmup
+        # factor rounding to the same number)
+        self._last_crc: int | None = None
+        # Coalesces bursts of writes (e.g. a user dragging several PID
+        # gain sliders) into a single disk save
+        self._save_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=1.0,
+            immediate=False,
+            function=self.async_save,
+        )
 
     async def async_load(self) -> None:
         """Load stored data from disk.
@@ -63,11 +87,14 @@ class EmsZoneMasterStore:
         """
         stored = await self._store.async_load()
         if stored:
-            self._data = stored
+            self._warmup = stored.get("warmup_factors", {})
+            self._integrals = stored.get("pid_integrals", {})
+            self._setpoints = stored.get("manual_setpoints", {})
+            self._gains = stored.get("pid_gains", {})
             _LOGGER.debug(
                 "Loaded EMS Zone Master store: %d warmup factors, %d PID integrals",
-                len(self._data.get("warmup_factors", {})),
-                len(self._data.get("pid_integrals", {})),
+                len(self._warmup),
+                len(self._integrals),
             )
         else:
             _LOGGER.debug("No stored data found, starting fresh")
@@ -76,11 +103,40 @@ class EmsZoneMasterStore:
         """Save current data to disk.
 
         Called periodically and on integration shutdown to persist
-        learned warmup factors and PID integrals.
+        learned warmup factors and PID integrals. Skipped when nothing
+        changed since the last save, so a stable system does not rewrite
+        an identical JSON blob every persistence interval (matters for
+        flash-based HAOS installs).
         """
-        await self._store.async_save(self._data)
+        if not self._dirty:
+            return
+        self._dirty = False
+        data = {
+            "warmup_factors": self._warmup,
+            "pid_integrals": self._integrals,
+            "manual_setpoints": self._setpoints,
+            "pid_gains": self._gains,
+        }
+        # CRC32 over the compact serialization is a few microseconds;
+        # the atomic write it avoids is milliseconds plus flash wear
+        crc = zlib.crc32(
+            json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+        )
+        if crc == self._last_crc:
+            return
+        self._last_crc = crc
+        await self._store.async_save(data)
         _LOGGER.debug("Saved EMS Zone Master store")
 
+    async def async_save_debounced(self) -> None:
+        """Save to disk after a short quiet period.
+
+        Rapid successive calls within the cooldown window collapse into
+        one disk write. Use for bursty updates like UI slider changes;
+        use async_save directly when the write must land now (shutdown).
+        """
+        await self._save_debouncer.async_call()
+
     def get_warmup_factor(self, zone_name: str) -> float | None:
         """Get the stored warmup factor for a zone.
 
@@ -90,7 +146,7 @@ class EmsZoneMasterStore:
         Returns:
             Warmup factor in minutes per degree, or None if not stored
         """
-        return self._data.get("warmup_factors", {}).get(zone_name)
+        return self._warmup.get(zone_name)
 
     def set_warmup_factor(self, zone_name: str, factor: float) -> None:
         """Store a warmup factor for a zone.
@@ -99,9 +155,12 @@ class EmsZoneMasterStore:
             zone_name: Name of the zone
             factor: Warmup factor in minutes per degree
         """
-        if "warmup_factors" not in self._data:
-            self._data["warmup_factors"] = {}
-        self._data["warmup_factors"][zone_name] = factor
+        # Quantize to 3 decimals: the learned running average otherwise
+        # accumulates full fp64 noise (e.g. 28.333333333333332) that bloats
+        # the JSON without physical meaning. Round-trip is exact since the
+        # coordinator restores the rounded value.
+        self._warmup[zone_name] = round(factor, 3)
+        self._dirty = True
         _LOGGER.debug("Updated warmup factor for %s: %.2f min/°C", zone_name, factor)
 
     def get_pid_integral(self, zone_name: str) -> float | None:
@@ -113,7 +172,7 @@ class EmsZoneMasterStore:
         Returns:
             PID integral value, or None if not stored
         """
-        return self._data.get("pid_integrals", {}).get(zone_name)
+        return self._integrals.get(zone_name)
 
     def set_pid_integral(self, zone_name: str, integral: float) -> None:
         """Store a PID integral for a zone.
@@ -122,9 +181,10 @@ class EmsZoneMasterStore:
             zone_name: Name of the zone
             integral: PID integral value
         """
-        if "pid_integrals" not in self._data:
-            self._data["pid_integrals"] = {}
-        self._data["pid_integrals"][zone_name] = integral
+        # Same quantization rationale as warmup factors; 4 decimals is far
+        # below the resolution that matters for bumpless transfer.
+        self._integrals[zone_name] = round(integral, 4)
+        self._dirty = True
 
     def get_manual_setpoint(self, zone_name: str) -> float | None:
         """Get the stored manual setpoint for a zone.
@@ -135,7 +195,7 @@ class EmsZoneMasterStore:
         Returns:
             Manual setpoint temperature, or None if not stored/cleared
         """
-        return self._data.get("manual_setpoints", {}).get(zone_name)
+        return self._setpoints.get(zone_name)
 
     def set_manual_setpoint(self, zone_name: str, setpoint: float | None) -> None:
         """Store or clear a manual setpoint for a zone.
@@ -144,13 +204,13 @@ class EmsZoneMasterStore:
             zone_name: Name of the zone
             setpoint: Manual setpoint temperature, or None to clear
         """
-        if "manual_setpoints" not in self._data:
-            self._data["manual_setpoints"] = {}
         if setpoint is None:
-            self._data["manual_setpoints"].pop(zone_name, None)
+            if self._setpoints.pop(zone_name, None) is not None:
+                self._dirty = True
             _LOGGER.debug("Cleared manual setpoint for %s", zone_name)
         else:
-            self._data["manual_setpoints"][zone_name] = setpoint
+            self._setpoints[zone_name] = setpoint
+            self._dirty = True
             _LOGGER.debug("Stored manual setpoint for %s: %.1f°C", zone_name, setpoint)
 
     def clear_zone(self, zone_name: str) -> None:
@@ -161,31 +221,28 @@ class EmsZoneMasterStore:
         Args:
             zone_name: Name of the zone to clear
         """
-        if "warmup_factors" in self._data:
-            self._data["warmup_factors"].pop(zone_name, None)
-        if "pid_integrals" in self._data:
-            self._data["pid_integrals"].pop(zone_name, None)
-        if "manual_setpoints" in self._data:
-            self._data["manual_setpoints"].pop(zone_name, None)
-        if "pid_gains" in self._data:
-            self._data["pid_gains"].pop(zone_name, None)
+        self._warmup.pop(zone_name, None)
+        self._integrals.pop(zone_name, None)
+        self._setpoints.pop(zone_name, None)
+        self._gains.pop(zone_name, None)
+        self._dirty = True
         _LOGGER.debug("Cleared stored data for zone: %s", zone_name)
 
-    def get_all_warmup_factors(self) -> dict[str, float]:
+    def get_all_warmup_factors(self) -> MappingProxyType[str, float]:
         """Get all stored warmup factors.
 
         Returns:
-            Dictionary mapping zone names to warmup factors
+            Read-only view mapping zone names to warmup factors
         """
-        return dict(self._data.get("warmup_factors", {}))
+        return MappingProxyType(self._warmup)
 
-    def get_all_pid_integrals(self) -> dict[str, float]:
+    def get_all_pid_integrals(self) -> MappingProxyType[str, float]:
         """Get all stored PID integrals.
 
         Returns:
-            Dictionary mapping zone names to PID integrals
+            Read-only view mapping zone names to PID integrals
         """
-        return dict(self._data.get("pid_integrals", {}))
+        return MappingProxyType(self._integrals)
 
     def get_pid_gains(self, zone_name: str) -> dict[str, float] | None:
         """Get the stored PID gains for a zone.
@@ -196,7 +253,7 @@ class EmsZoneMasterStore:
         Returns:
             Dictionary with kp, ki, kd, ke values, or None if not stored
         """
-        return self._data.get("pid_gains", {}).get(zone_name)
+        return self._gains.get(zone_name)
 
     def set_pid_gains(
         self, zone_name: str, kp: float, ki: float, kd: float, ke: float
@@ -210,14 +267,13 @@ class EmsZoneMasterStore:
             kd: Derivative gain
             ke: Outdoor compensation gain
         """
-        if "pid_gains" not in self._data:
-            self._data["pid_gains"] = {}
-        self._data["pid_gains"][zone_name] = {
+        self._gains[zone_name] = {
             "kp": kp,
             "ki": ki,
             "kd": kd,
             "ke": ke,
         }
+        self._dirty = True
         _LOGGER.debug(
             "Stored PID gains for %s: Kp=%.1f, Ki=%.2f, Kd=%.1f, Ke=%.3f",
             zone_name,
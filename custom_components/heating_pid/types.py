@@ -93,7 +93,7 @@ class CoordinatorStateDict(TypedDict):
     quiet_mode_ratio: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneData:
     """Runtime data for a heating zone."""
 
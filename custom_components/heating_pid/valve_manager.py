@@ -7,12 +7,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
 
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 
-from .const import VALVE_MAINTENANCE_DAYS, VALVE_MAINTENANCE_DURATION, VALVE_MAINTENANCE_HOUR
+from .const import (
+    SERVICE_CALL_TIMEOUT,
+    VALVE_MAINTENANCE_DAYS,
+    VALVE_MAINTENANCE_DURATION,
+    VALVE_MAINTENANCE_HOUR,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +43,18 @@ class ValveManager:
         min_off_time: Minimum time valve must stay closed (minutes)
     """
 
+    __slots__ = (
+        "hass",
+        "_min_on_time",
+        "_min_off_time",
+        "_debug",
+        "_min_on_time_s",
+        "_min_off_time_s",
+        "_entity_payloads",
+        "_last_climate_setpoint",
+        "_domain_handlers",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -48,226 +71,335 @@ class ValveManager:
         self.hass = hass
         self._min_on_time = min_on_time
         self._min_off_time = min_off_time
+        # Cached debug-enabled flag; skips argument setup for the per-zone
+        # log lines when DEBUG is off
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Thresholds in seconds so anti-cycling checks compare monotonic
+        # deltas directly, without a per-check divide
+        self._min_on_time_s = min_on_time * 60
+        self._min_off_time_s = min_off_time * 60
+
+        # Static service payloads are identical per entity for the lifetime
+        # of the manager - build them once instead of on every service call.
+        # Treat the cached dicts as read-only.
+        self._entity_payloads: dict[str, dict[str, dict[str, str]]] = {}
+
+        # Last setpoint successfully commanded per climate valve, to skip
+        # the redundant set_temperature call under steady-state demand.
+        self._last_climate_setpoint: dict[str, float] = {}
+
+        # Domain dispatch table; a dict lookup replaces the if/elif chain
+        # run once per zone per cycle.
+        self._domain_handlers = {
+            "switch": self._control_switch_valve,
+            "climate": self._control_climate_valve,
+        }
+
+    def _payloads_for(self, entity_id: str) -> dict[str, dict[str, str]]:
+        """Get (or build) the static service payloads for an entity.
+
+        Args:
+            entity_id: Valve entity ID
+
+        Returns:
+            Dict with "entity", "climate_heat" and "climate_off" payloads
+        """
+        payloads = self._entity_payloads.get(entity_id)
+        if payloads is None:
+            payloads = {
+                "entity": {"entity_id": entity_id},
+                "climate_heat": {"entity_id": entity_id, "hvac_mode": "heat"},
+                "climate_off": {"entity_id": entity_id, "hvac_mode": "off"},
+            }
+            self._entity_payloads[entity_id] = payloads
+        return payloads
 
     async def set_valve_state(
         self,
         entity_id: str,
-        valve_opened_at: datetime | None,
-        valve_closed_at: datetime | None,
+        valve_opened_mono: float | None,
+        valve_closed_mono: float | None,
         setpoint: float,
         should_open: bool,
-        cooldown_active: bool,
-    ) -> tuple[datetime | None, datetime | None, datetime]:
+        domain: str | None = None,
+        now: datetime | None = None,
+    ) -> tuple[float | None, float | None, datetime]:
         """Control a valve with anti-cycling protection.
 
+        Anti-cycling windows are measured on the monotonic clock: it is a
+        plain float compare, immune to wall-clock jumps, and cheaper than
+        tz-aware datetime arithmetic. Only the returned activity timestamp
+        (used for maintenance scheduling) stays wall-clock.
+
         Args:
             entity_id: Valve entity ID
-            valve_opened_at: When valve was last opened
-            valve_closed_at: When valve was last closed
+            valve_opened_mono: Monotonic timestamp when valve was last opened
+            valve_closed_mono: Monotonic timestamp when valve was last closed
             setpoint: Current zone setpoint (for climate entities)
-            should_open: True to open valve, False to close
-            cooldown_active: Whether cooldown mode is active
+            should_open: True to open valve, False to close (the caller
+                has already folded cooldown into this flag)
+            domain: Pre-parsed entity domain, or None to parse from entity_id
+            now: Current time, or None to read the clock (the coordinator
+                passes one timestamp for the whole valve pass)
 
         Returns:
-            Tuple of (new_valve_opened_at, new_valve_closed_at, last_activity)
+            Tuple of (new_valve_opened_mono, new_valve_closed_mono, last_activity)
         """
-        # Don't open valves during cooldown
-        if should_open and cooldown_active:
-            should_open = False
+        if now is None:
+            now = dt_util.now()
 
         state = self.hass.states.get(entity_id)
         if state is None:
             _LOGGER.warning("Valve entity not found: %s", entity_id)
-            return valve_opened_at, valve_closed_at, dt_util.now()
+            return valve_opened_mono, valve_closed_mono, now
 
-        domain = entity_id.split(".")[0]
-        now = dt_util.now()
+        if domain is None:
+            domain = entity_id.partition(".")[0]
 
-        if domain == "switch":
-            return await self._control_switch_valve(
-                entity_id, valve_opened_at, valve_closed_at, should_open, now
-            )
-        elif domain == "climate":
-            return await self._control_climate_valve(
-                entity_id, valve_opened_at, valve_closed_at, should_open, setpoint, now
-            )
-        else:
+        handler = self._domain_handlers.get(domain)
+        if handler is None:
             _LOGGER.warning(
                 "Unsupported valve entity domain: %s for %s",
                 domain,
                 entity_id,
             )
-            return valve_opened_at, valve_closed_at, now
+            return valve_opened_mono, valve_closed_mono, now
+
+        mono_now = time.monotonic()
+
+        # Resolve whether the entity is currently "open" for the
+        # requested action. For climate, opening keys off mode == "heat"
+        # while closing applies to any mode that is not already off.
+        if domain == "switch":
+            is_open = state.state == "on"
+        elif should_open:
+            is_open = state.state == "heat"
+        else:
+            is_open = state.state not in ("off", "unavailable")
+
+        # Decide synchronously whether anything needs to go out; in
+        # steady state every valve resolves here without entering the
+        # domain handler at all.
+        if should_open == is_open:
+            if domain == "switch" or not should_open:
+                # Already in the requested state
+                return valve_opened_mono, valve_closed_mono, now
+            if self._last_climate_setpoint.get(entity_id) == setpoint:
+                # Heating with the commanded setpoint already applied
+                return valve_opened_mono, valve_closed_mono, now
+        elif self._anti_cycling_blocked(
+            entity_id,
+            is_open,
+            should_open,
+            valve_opened_mono,
+            valve_closed_mono,
+            mono_now,
+        ):
+            return valve_opened_mono, valve_closed_mono, now
+
+        return await handler(
+            entity_id,
+            valve_opened_mono,
+            valve_closed_mono,
+            should_open,
+            setpoint,
+            state,
+            now,
+            mono_now,
+        )
+
+    def _anti_cycling_blocked(
+        self,
+        entity_id: str,
+        is_open: bool,
+        should_open: bool,
+        valve_opened_mono: float | None,
+        valve_closed_mono: float | None,
+        mono_now: float,
+    ) -> bool:
+        """Check whether anti-cycling protection blocks the action.
+
+        Pure arithmetic over monotonic timestamps, so the caller can
+        reject a toggle before creating any coroutine.
+
+        Args:
+            entity_id: Valve entity ID (for logging)
+            is_open: Whether the valve is currently open
+            should_open: Requested direction
+            valve_opened_mono: Monotonic timestamp when valve was last opened
+            valve_closed_mono: Monotonic timestamp when valve was last closed
+            mono_now: Current monotonic timestamp
+
+        Returns:
+            True if the min on/off window forbids the toggle
+        """
+        if should_open and not is_open:
+            if valve_closed_mono is not None and self._min_off_time_s > 0:
+                time_since_close = mono_now - valve_closed_mono
+                if time_since_close < self._min_off_time_s:
+                    if self._debug:
+                        _LOGGER.debug(
+                            "Valve %s: skipping open, only %.1f min since close (min: %d)",
+                            entity_id,
+                            time_since_close / 60,
+                            self._min_off_time,
+                        )
+                    return True
+        elif not should_open and is_open:
+            if valve_opened_mono is not None and self._min_on_time_s > 0:
+                time_since_open = mono_now - valve_opened_mono
+                if time_since_open < self._min_on_time_s:
+                    if self._debug:
+                        _LOGGER.debug(
+                            "Valve %s: skipping close, only %.1f min since open (min: %d)",
+                            entity_id,
+                            time_since_open / 60,
+                            self._min_on_time,
+                        )
+                    return True
+        return False
 
     async def _control_switch_valve(
         self,
         entity_id: str,
-        valve_opened_at: datetime | None,
-        valve_closed_at: datetime | None,
+        valve_opened_mono: float | None,
+        valve_closed_mono: float | None,
         should_open: bool,
+        setpoint: float,
+        state: State,
         now: datetime,
-    ) -> tuple[datetime | None, datetime | None, datetime]:
+        mono_now: float,
+    ) -> tuple[float | None, float | None, datetime]:
         """Control a switch-type valve entity.
 
+        The caller has already verified a toggle is needed and allowed
+        by anti-cycling, so this just issues the service call.
+
         Args:
             entity_id: Switch entity ID
-            valve_opened_at: When valve was last opened
-            valve_closed_at: When valve was last closed
+            valve_opened_mono: Monotonic timestamp when valve was last opened
+            valve_closed_mono: Monotonic timestamp when valve was last closed
             should_open: True to turn on (open), False to turn off (close)
+            setpoint: Unused for switches (uniform handler signature)
+            state: Current entity state (uniform handler signature)
             now: Current time
+            mono_now: Current monotonic timestamp
 
         Returns:
-            Tuple of (new_valve_opened_at, new_valve_closed_at, last_activity)
+            Tuple of (new_valve_opened_mono, new_valve_closed_mono, last_activity)
         """
-        current_state = self.hass.states.get(entity_id)
-        if current_state is None:
-            return valve_opened_at, valve_closed_at, now
-
-        is_on = current_state.state == "on"
-
-        if should_open and not is_on:
-            # Check minimum off-time before opening
-            if valve_closed_at and self._min_off_time > 0:
-                time_since_close = (now - valve_closed_at).total_seconds() / 60
-                if time_since_close < self._min_off_time:
-                    _LOGGER.debug(
-                        "Valve %s: skipping open, only %.1f min since close (min: %d)",
-                        entity_id,
-                        time_since_close,
-                        self._min_off_time,
-                    )
-                    return valve_opened_at, valve_closed_at, now
-
+        if should_open:
             await self._safe_service_call(
-                "switch", "turn_on", {"entity_id": entity_id}
+                "switch", "turn_on", self._payloads_for(entity_id)["entity"]
             )
             _LOGGER.debug("Opened valve: %s", entity_id)
-            return now, valve_closed_at, now
-
-        elif not should_open and is_on:
-            # Check minimum on-time before closing
-            if valve_opened_at and self._min_on_time > 0:
-                time_since_open = (now - valve_opened_at).total_seconds() / 60
-                if time_since_open < self._min_on_time:
-                    _LOGGER.debug(
-                        "Valve %s: skipping close, only %.1f min since open (min: %d)",
-                        entity_id,
-                        time_since_open,
-                        self._min_on_time,
-                    )
-                    return valve_opened_at, valve_closed_at, now
-
-            await self._safe_service_call(
-                "switch", "turn_off", {"entity_id": entity_id}
-            )
-            _LOGGER.debug("Closed valve: %s", entity_id)
-            return valve_opened_at, now, now
+            return mono_now, valve_closed_mono, now
 
-        return valve_opened_at, valve_closed_at, now
+        await self._safe_service_call(
+            "switch", "turn_off", self._payloads_for(entity_id)["entity"]
+        )
+        _LOGGER.debug("Closed valve: %s", entity_id)
+        return valve_opened_mono, mono_now, now
 
     async def _control_climate_valve(
         self,
         entity_id: str,
-        valve_opened_at: datetime | None,
-        valve_closed_at: datetime | None,
+        valve_opened_mono: float | None,
+        valve_closed_mono: float | None,
         should_open: bool,
         setpoint: float,
+        state: State,
         now: datetime,
-    ) -> tuple[datetime | None, datetime | None, datetime]:
+        mono_now: float,
+    ) -> tuple[float | None, float | None, datetime]:
         """Control a climate-type valve entity (e.g., TRV).
 
         For climate entities, we set HVAC mode to heat/off and
-        optionally set the target temperature.
+        optionally set the target temperature. The caller has already
+        verified an action is needed and allowed by anti-cycling.
 
         Args:
             entity_id: Climate entity ID
-            valve_opened_at: When valve was last opened
-            valve_closed_at: When valve was last closed
+            valve_opened_mono: Monotonic timestamp when valve was last opened
+            valve_closed_mono: Monotonic timestamp when valve was last closed
             should_open: True to enable heating, False to turn off
             setpoint: Target temperature to set
+            state: Current entity state (fetched by the caller)
             now: Current time
+            mono_now: Current monotonic timestamp
 
         Returns:
-            Tuple of (new_valve_opened_at, new_valve_closed_at, last_activity)
+            Tuple of (new_valve_opened_mono, new_valve_closed_mono, last_activity)
         """
-        current_state = self.hass.states.get(entity_id)
-        if current_state is None:
-            return valve_opened_at, valve_closed_at, now
-
-        current_mode = current_state.state
-        new_opened_at = valve_opened_at
-        new_closed_at = valve_closed_at
+        new_opened_mono = valve_opened_mono
+        new_closed_mono = valve_closed_mono
 
         if should_open:
-            # Check minimum off-time before opening
-            if current_mode != "heat":
-                if valve_closed_at and self._min_off_time > 0:
-                    time_since_close = (now - valve_closed_at).total_seconds() / 60
-                    if time_since_close < self._min_off_time:
-                        _LOGGER.debug(
-                            "Climate %s: skipping heat, only %.1f min since off (min: %d)",
-                            entity_id,
-                            time_since_close,
-                            self._min_off_time,
-                        )
-                        return valve_opened_at, valve_closed_at, now
-
+            if state.state != "heat":
                 await self._safe_service_call(
                     "climate",
                     "set_hvac_mode",
-                    {"entity_id": entity_id, "hvac_mode": "heat"},
+                    self._payloads_for(entity_id)["climate_heat"],
                 )
                 _LOGGER.debug("Set climate to heat: %s", entity_id)
-                new_opened_at = now
-
-            # Also set temperature to zone setpoint
-            await self._safe_service_call(
-                "climate",
-                "set_temperature",
-                {"entity_id": entity_id, "temperature": setpoint},
-            )
-
-        elif current_mode not in ("off", "unavailable"):
-            # Check minimum on-time before closing
-            if valve_opened_at and self._min_on_time > 0:
-                time_since_open = (now - valve_opened_at).total_seconds() / 60
-                if time_since_open < self._min_on_time:
-                    _LOGGER.debug(
-                        "Climate %s: skipping off, only %.1f min since heat (min: %d)",
-                        entity_id,
-                        time_since_open,
-                        self._min_on_time,
-                    )
-                    return valve_opened_at, valve_closed_at, now
+                new_opened_mono = mono_now
 
+            # Also set temperature to zone setpoint, unless it already
+            # matches the last value we commanded for this entity
+            if self._last_climate_setpoint.get(entity_id) != setpoint:
+                success = await self._safe_service_call(
+                    "climate",
+                    "set_temperature",
+                    {"entity_id": entity_id, "temperature": setpoint},
+                )
+                if success:
+                    self._last_climate_setpoint[entity_id] = setpoint
+                else:
+                    self._last_climate_setpoint.pop(entity_id, None)
+        else:
             await self._safe_service_call(
                 "climate",
                 "set_hvac_mode",
-                {"entity_id": entity_id, "hvac_mode": "off"},
+                self._payloads_for(entity_id)["climate_off"],
             )
             _LOGGER.debug("Set climate to off: %s", entity_id)
-            new_closed_at = now
+            new_closed_mono = mono_now
 
-        return new_opened_at, new_closed_at, now
+        return new_opened_mono, new_closed_mono, now
 
     async def perform_maintenance(
         self,
         entity_id: str,
         duration: int,
+        domain: str | None = None,
+        now: datetime | None = None,
+        on_complete: Callable[[], None] | None = None,
     ) -> datetime:
         """Perform a maintenance cycle on a valve.
 
-        Opens the valve briefly then closes it to prevent seizing.
+        Opens the valve, schedules the close after ``duration`` seconds
+        via the event loop and returns immediately - no task sits
+        parked in asyncio.sleep for the whole cycle. The caller must
+        keep the zone out of the regular valve pass until on_complete
+        fires, or a tick landing inside the window could close the
+        valve mid-exercise.
 
         Args:
             entity_id: Valve entity ID
             duration: Duration in seconds to keep valve open
+            domain: Pre-parsed entity domain, or None to parse from entity_id
+            now: Current time, or None to read the clock
+            on_complete: Called after the closing service call has been
+                dispatched (also invoked immediately when nothing was
+                done, e.g. an unsupported domain)
 
         Returns:
-            Timestamp when maintenance was performed
+            Timestamp when maintenance was started
         """
-        domain = entity_id.split(".")[0]
-        now = dt_util.now()
+        if domain is None:
+            domain = entity_id.partition(".")[0]
+        if now is None:
+            now = dt_util.now()
 
         _LOGGER.debug(
             "Performing valve maintenance cycle for %s (%d seconds)",
@@ -275,34 +407,28 @@ class ValveManager:
             duration,
         )
 
-        try:
-            if domain == "switch":
-                await self._safe_service_call(
-                    "switch", "turn_on", {"entity_id": entity_id}
-                )
-                await asyncio.sleep(duration)
-                await self._safe_service_call(
-                    "switch", "turn_off", {"entity_id": entity_id}
-                )
-            elif domain == "climate":
-                await self._safe_service_call(
-                    "climate",
-                    "set_hvac_mode",
-                    {"entity_id": entity_id, "hvac_mode": "heat"},
-                )
-                await asyncio.sleep(duration)
-                await self._safe_service_call(
-                    "climate",
-                    "set_hvac_mode",
-                    {"entity_id": entity_id, "hvac_mode": "off"},
-                )
+        payloads = self._payloads_for(entity_id)
+        if domain == "switch":
+            open_call = ("switch", "turn_on", payloads["entity"])
+            close_call = ("switch", "turn_off", payloads["entity"])
+        elif domain == "climate":
+            open_call = ("climate", "set_hvac_mode", payloads["climate_heat"])
+            close_call = ("climate", "set_hvac_mode", payloads["climate_off"])
+        else:
+            if on_complete is not None:
+                on_complete()
+            return now
+
+        await self._safe_service_call(*open_call)
 
+        async def _close_valve(_fire_time: datetime) -> None:
+            await self._safe_service_call(*close_call)
             _LOGGER.info("Valve maintenance complete: %s", entity_id)
-            return now
+            if on_complete is not None:
+                on_complete()
 
-        except Exception as err:
-            _LOGGER.error("Valve maintenance failed for %s: %s", entity_id, err)
-            return now
+        async_call_later(self.hass, duration, _close_valve)
+        return now
 
     def check_maintenance_needed(
         self,
@@ -339,22 +465,53 @@ class ValveManager:
         return True
 
     async def _safe_service_call(
-        self, domain: str, service: str, data: dict[str, str | float]
+        self,
+        domain: str,
+        service: str,
+        data: dict[str, str | float],
+        blocking: bool = False,
     ) -> bool:
         """Call a service with error handling.
 
+        Non-blocking by default: the call is validated and dispatched
+        but the valve pass does not wait for the target entity's
+        round-trip. Pass blocking=True when completion matters; that
+        path is bounded by SERVICE_CALL_TIMEOUT.
+
         Args:
             domain: Service domain (e.g., "switch", "climate", "number")
             service: Service name (e.g., "turn_on", "set_temperature")
             data: Service data parameters
+            blocking: Wait for the service call to complete
 
         Returns:
-            True if service call succeeded, False otherwise
+            True if service call was dispatched (or completed when
+            blocking), False otherwise
         """
         try:
-            await self.hass.services.async_call(domain, service, data, blocking=True)
+            if blocking:
+                # Bound the wait so one slow entity cannot stall the
+                # whole coordinator cycle
+                async with asyncio.timeout(SERVICE_CALL_TIMEOUT):
+                    await self.hass.services.async_call(
+                        domain, service, data, blocking=True
+                    )
+            else:
+                await self.hass.services.async_call(
+                    domain, service, data, blocking=False
+                )
             return True
-        except Exception as err:
+        except TimeoutError:
+            entity_id = data.get("entity_id", "unknown")
+            _LOGGER.warning(
+                "Service call %s.%s timed out after %.0fs for %s",
+                domain,
+                service,
+                SERVICE_CALL_TIMEOUT,
+                entity_id,
+            )
+            return False
+        except (vol.Invalid, HomeAssistantError) as err:
             entity_id = data.get("entity_id", "unknown")
             _LOGGER.error(
                 "Service call %s.%s failed for %s: %s", domain, service, entity_id, err